@@ -1,80 +1,125 @@
-from flask import Flask, render_template, request, jsonify, make_response
+# Monkey-patch as early as possible (before sqlite3/threading are imported)
+# so blocking calls yield cooperatively under gevent workers; plain threads
+# are the fallback when gevent is not installed
+try:
+    from gevent import monkey
+    monkey.patch_all()
+    ASYNC_MODE = 'gevent'
+except ImportError:
+    ASYNC_MODE = 'threading'
+
+from flask import Flask, render_template, request, jsonify, make_response, Response, stream_with_context
 from flask_socketio import SocketIO, emit
 import os
 import sqlite3
 import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timedelta
 import logging
 import re
+import functools
 from steam_scraper import SteamScraper
-def parse_steam_date_to_comparable(date_str):
-    """Parse Steam date to a comparable date, return None if too vague"""
-    if not date_str or date_str.strip() in ['Unknown', 'TBA', 'TBD', 'Coming Soon']:
-        return None
-        
-    date_str = date_str.strip()
-    
-    # Skip vague dates immediately
-    if re.match(r'^\d{4}$', date_str):  # Just year like "2025"
-        return None
-    if re.match(r'Q[1-4]\s+\d{4}', date_str):  # Quarter like "Q1 2025"
-        return None
-    
-    try:
-        # Handle "16 Oct, 2025" format - SPECIFIC DATE
-        if re.match(r'\d{1,2}\s+\w{3},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%d %b, %Y")
-            
-        # Handle "Oct 16, 2025" format - SPECIFIC DATE
-        if re.match(r'\w{3}\s+\d{1,2},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%b %d, %Y")
-            
-        # Handle "October 16, 2025" format - SPECIFIC DATE
-        if re.match(r'\w+\s+\d{1,2},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%B %d, %Y")
+import db_pool
 
-        # Handle "October 2025" format - MONTH AND YEAR (use first day)
-        if re.match(r'^\w+\s+\d{4}$', date_str):
-            try:
-                return datetime.strptime(date_str, "%B %Y")
-            except ValueError:
-                return datetime.strptime(date_str, "%b %Y")
+# orjson's C serialiser is several times faster than stdlib json for the
+# export hot path; fall back quietly when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-        return None
-        
-    except Exception as e:
+def _dumps(obj):
+    """Serialise one export row as compact JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'))
+
+# Date strings too vague to place in a range
+_VAGUE_DATES = frozenset({'', 'Unknown', 'TBA', 'TBD', 'Coming Soon'})
+
+# Single alternation covering every Steam date shape; the matching group
+# name tells us which format to parse with
+_DATE_RE = re.compile(
+    r'^(?:'
+    r'(?P<dmy>\d{1,2}\s+[A-Za-z]{3},\s+\d{4})'      # "16 Oct, 2025"
+    r'|(?P<mdy>[A-Za-z]{3}\s+\d{1,2},\s+\d{4})'     # "Oct 16, 2025"
+    r'|(?P<full>[A-Za-z]+\s+\d{1,2},\s+\d{4})'      # "October 16, 2025"
+    r'|(?P<month_only>[A-Za-z]+\s+\d{4})'           # "October 2025"; excludes "Q1 2025"
+    r')$'
+)
+# Month token -> number, covering both %b and %B spellings; building the
+# datetime from slices avoids strptime's pure-Python format machinery
+_MONTHS = {name: i for i, names in enumerate((
+    ('Jan', 'January'), ('Feb', 'February'), ('Mar', 'March'),
+    ('Apr', 'April'), ('May', 'May'), ('Jun', 'June'),
+    ('Jul', 'July'), ('Aug', 'August'), ('Sep', 'September'),
+    ('Oct', 'October'), ('Nov', 'November'), ('Dec', 'December')), 1)
+    for name in names}
+
+@functools.lru_cache(maxsize=100_000)
+def _parse_steam_date(date_str):
+    """Parse a stripped Steam date, returning (datetime, is_month_only).
+
+    Release date strings repeat heavily across games, so results are
+    memoized. Vague dates ("2025", "Q1 2025", "TBA", ...) give (None, False).
+    """
+    if date_str in _VAGUE_DATES:
+        return None, False
+
+    m = _DATE_RE.match(date_str)
+    if not m:
+        return None, False
+
+    kind = m.lastgroup
+    try:
+        parts = date_str.replace(',', '').split()
+        if kind == 'dmy':
+            day, month, year = parts
+        elif kind in ('mdy', 'full'):
+            month, day, year = parts
+        else:  # month_only
+            (month, year), day = parts, 1
+        return datetime(int(year), _MONTHS[month], int(day)), kind == 'month_only'
+    except (KeyError, ValueError) as e:
         logger.error(f"Date parsing error for '{date_str}': {e}")
+        return None, False
+
+@functools.lru_cache(maxsize=4096)
+def month_bounds(year, month):
+    """First and last day of a month, computed once per (year, month)"""
+    start = datetime(year, month, 1)
+    if month == 12:
+        end = datetime(year + 1, 1, 1) - timedelta(days=1)
+    else:
+        end = datetime(year, month + 1, 1) - timedelta(days=1)
+    return start, end
+
+def parse_steam_date_to_comparable(date_str):
+    """Parse Steam date to a comparable date, return None if too vague"""
+    if not date_str:
         return None
+    return _parse_steam_date(date_str.strip())[0]
 
 def is_steam_date_in_range(release_date, start_date_str, end_date_str):
     """Simple, robust date range checking"""
-    release_dt = parse_steam_date_to_comparable(release_date)
-    
+    if not release_date:
+        return False
+
+    release_dt, is_month_only = _parse_steam_date(release_date.strip())
     if not release_dt:
         return False
-        
+
     try:
         start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
         end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")
-        
-        # Check if it's a month-only date (like "October 2025")
-        original_date = release_date.strip()
-        month_patterns = [r'^\w+\s+\d{4}$']  # "October 2025" or "Oct 2025"
-        
-        is_month_only = any(re.match(pattern, original_date) for pattern in month_patterns)
-        
+
         if is_month_only:
-            # For month-only dates, check if the ENTIRE month overlaps with the range
-            month_start = release_dt.replace(day=1)
-            # Get last day of the month
-            if release_dt.month == 12:
-                month_end = release_dt.replace(year=release_dt.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                month_end = release_dt.replace(month=release_dt.month + 1, day=1) - timedelta(days=1)
-            
-            # Check if ANY part of the month overlaps with the search range
+            # For month-only dates, check if ANY part of the month overlaps
+            # with the search range
+            month_start, month_end = month_bounds(release_dt.year, release_dt.month)
             return not (month_end < start_dt or month_start > end_dt)
         else:
             # For specific dates, simple comparison
@@ -85,40 +130,208 @@ def is_steam_date_in_range(release_date, start_date_str, end_date_str):
         return False
 import glob
 
+def steam_date_to_bounds(date_str):
+    """Convert a Steam date string to (start, end) unix seconds, or (None, None) if too vague"""
+    if not date_str:
+        return None, None
+
+    release_dt, is_month_only = _parse_steam_date(date_str.strip())
+    if not release_dt:
+        return None, None
+
+    if is_month_only:
+        # Month-only date: span the entire month
+        month_start, month_end = month_bounds(release_dt.year, release_dt.month)
+        return int(month_start.timestamp()), int(month_end.timestamp())
+
+    ts = int(release_dt.timestamp())
+    return ts, ts
+
+# Databases already migrated this run. The global lock only guards this
+# bookkeeping; waiting on a database's write connection happens under a
+# per-database lock so one busy writer can't stall every other database.
+_migrated_dbs = set()
+_migrate_lock = threading.Lock()
+_db_migrate_locks = {}
+
+# Export column list spelled out so queries avoid g.* and the internal
+# release_dt_* bookkeeping columns
+_EXPORT_COLUMNS = ', '.join('g.%s' % c for c in (
+    'app_id', 'name', 'developer', 'publisher', 'release_date',
+    'full_description', 'short_description', 'price',
+    'system_requirements', 'supported_languages', 'user_rating',
+    'review_count', 'steam_url', 'header_image',
+    'screenshot1', 'screenshot2', 'screenshot3', 'screenshot4',
+    'screenshot5', 'last_updated',
+))
+
+# Vectorised-parsed legacy rows keyed by database, invalidated on file change
+_legacy_frame_cache = {}
+
+def _db_file_key(db_name):
+    """Cache key capturing the database file state (WAL writes included)"""
+    key = []
+    for path in (db_name, db_name + '-wal'):
+        try:
+            st = os.stat(path)
+            key.extend((st.st_mtime, st.st_size))
+        except OSError:
+            key.extend((0, 0))
+    return tuple(key)
+
+def _legacy_rows_frame(db_name):
+    """Load rows lacking normalised bounds and parse their dates in bulk.
+
+    The whole column is parsed with vectorised pd.to_datetime passes (one
+    per known format) into start_dt/end_dt bounds, and the resulting frame
+    is cached keyed by the file's (mtime, size) so repeated searches
+    against an unchanged database skip parsing entirely.
+    """
+    import pandas as pd
+
+    key = _db_file_key(db_name)
+    cached = _legacy_frame_cache.get(db_name)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    with db_pool.acquire(db_name) as conn:
+        df = pd.read_sql_query(
+            'SELECT app_id, name, developer, publisher, release_date, price '
+            'FROM games WHERE release_dt_start IS NULL', conn)
+
+    dates = df['release_date'].fillna('').str.strip()
+    day = pd.to_datetime(dates, format='%d %b, %Y', errors='coerce')
+    for fmt in ('%b %d, %Y', '%B %d, %Y'):
+        day = day.fillna(pd.to_datetime(dates, format=fmt, errors='coerce'))
+
+    # Month-only dates span the entire month
+    month_only = dates.where(dates.str.match(r'^[A-Za-z]+\s+\d{4}$'))
+    month = pd.to_datetime(month_only, format='%B %Y', errors='coerce')
+    month = month.fillna(pd.to_datetime(month_only, format='%b %Y', errors='coerce'))
+
+    df['start_dt'] = day.fillna(month)
+    df['end_dt'] = day.fillna(month + pd.offsets.MonthEnd(0))
+
+    _legacy_frame_cache[db_name] = (key, df)
+    return df
+
+def ensure_schema_upgrades(db_name):
+    """Apply in-place schema upgrades (normalised date columns, indexes) once per run"""
+    with _migrate_lock:
+        if db_name in _migrated_dbs:
+            return
+        db_lock = _db_migrate_locks.setdefault(db_name, threading.Lock())
+
+    with db_lock:
+        with _migrate_lock:
+            if db_name in _migrated_dbs:
+                return
+        with db_pool.acquire(db_name, write=True) as conn:
+            cursor = conn.cursor()
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(games)')}
+            if 'release_dt_start' not in columns:
+                cursor.execute('ALTER TABLE games ADD COLUMN release_dt_start INTEGER')
+                cursor.execute('ALTER TABLE games ADD COLUMN release_dt_end INTEGER')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_release ON games(release_dt_start, release_dt_end)')
+
+            # Tag uniqueness is enforced at the index level so exports can
+            # drop the per-group DISTINCT
+            cursor.execute('''
+                DELETE FROM tags WHERE id NOT IN
+                    (SELECT MIN(id) FROM tags GROUP BY app_id, tag)
+            ''')
+            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_tags_app_tag ON tags(app_id, tag)')
+
+            # Backfill rows that have not been normalised yet
+            cursor.execute('''
+                SELECT app_id, release_date FROM games
+                WHERE release_dt_start IS NULL AND release_date IS NOT NULL
+            ''')
+            updates = []
+            for app_id, release_date in cursor.fetchall():
+                start_ts, end_ts = steam_date_to_bounds(release_date)
+                if start_ts is not None:
+                    updates.append((start_ts, end_ts, app_id))
+            if updates:
+                cursor.executemany(
+                    'UPDATE games SET release_dt_start = ?, release_dt_end = ? WHERE app_id = ?',
+                    updates
+                )
+        with _migrate_lock:
+            _migrated_dbs.add(db_name)
+
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
-socketio = SocketIO(app, cors_allowed_origins="*")
+socketio = SocketIO(app, cors_allowed_origins="*", async_mode=ASYNC_MODE)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Global variables for scraping status
-scraping_status = {
-    'is_active': False,
-    'current_game': '',
-    'progress': 0,
-    'total_games': 0,
-    'existing_games': 0,
-    'scraped_count': 0,
-    'status_message': 'Ready'
-}
+@dataclass(frozen=True)
+class ScrapingState:
+    """Immutable snapshot of scraping progress broadcast to clients"""
+    is_active: bool = False
+    current_game: str = ''
+    progress: int = 0
+    total_games: int = 0
+    existing_games: int = 0
+    scraped_count: int = 0
+    status_message: str = 'Ready'
+
+# Stop signal for the active scrape; wait-free to check from worker loops
+stop_event = threading.Event()
+
+# Latest snapshot, swapped atomically under the lock rather than mutated
+# in place so readers never observe torn state
+scraping_state = ScrapingState()
+_state_lock = threading.Lock()
+
+def update_scraping_state(**changes):
+    """Replace the current state snapshot with an updated copy"""
+    global scraping_state
+    with _state_lock:
+        scraping_state = replace(scraping_state, **changes)
+    return scraping_state
 
 class WebScraper:
+    # Minimum seconds between progress emits (~5 Hz); each emit is a whole
+    # WebSocket frame, so per-game updates mostly waste CPU and bandwidth
+    EMIT_INTERVAL = 0.2
+
+    # Concurrent detail-page fetches; scraping is I/O-bound
+    MAX_WORKERS = 16
+
+    # Games per commit during bulk scrapes
+    COMMIT_EVERY = 500
+
     def __init__(self):
         self.scraper = None
         self.is_running = False
-        
-    def start_scraping(self, url, db_name, socketio_instance):
+        self._last_emit = 0.0
+        self._client_sid = None
+
+    def _emit_update(self, socketio_instance, force=False):
+        """Emit scraping_update, coalescing bursts unless force is set.
+
+        Updates go only to the initiating client's room rather than
+        broadcasting to every connected socket.
+        """
+        now = time.monotonic()
+        if force or now - self._last_emit >= self.EMIT_INTERVAL:
+            socketio_instance.emit('scraping_update', asdict(scraping_state),
+                                   to=self._client_sid)
+            self._last_emit = now
+
+    def start_scraping(self, url, db_name, socketio_instance, client_sid=None):
         """Start the scraping process with real-time updates"""
-        global scraping_status
-        
+        self._client_sid = client_sid
         try:
             logger.info(f"WebScraper.start_scraping called with URL: {url}, DB: {db_name}")
-            
-            scraping_status['is_active'] = True
-            scraping_status['status_message'] = 'Initializing scraper...'
-            socketio_instance.emit('scraping_update', scraping_status)
+
+            stop_event.clear()
+            update_scraping_state(is_active=True, status_message='Initializing scraper...')
+            self._emit_update(socketio_instance, force=True)
             
             logger.info("Initializing SteamScraper...")
             # Initialize scraper
@@ -131,66 +344,86 @@ class WebScraper:
             existing_games = self.scraper.get_existing_app_ids()
             logger.info(f"Found {len(existing_games)} existing games")
             
-            scraping_status['existing_games'] = len(existing_games)
-            socketio_instance.emit('scraping_update', scraping_status)
-            
-            scraping_status['status_message'] = 'Collecting game links...'
-            socketio_instance.emit('scraping_update', scraping_status)
+            update_scraping_state(existing_games=len(existing_games),
+                                  status_message='Collecting game links...')
+            self._emit_update(socketio_instance, force=True)
             
             # Get game links
             logger.info("Starting to collect game links...")
             game_links = self.scraper.scroll_and_collect_games()
             logger.info(f"Collected {len(game_links)} game links")
             
-            scraping_status['total_games'] = len(game_links)
-            scraping_status['scraped_count'] = 0
-            
-            # Update total including existing games
-            total_with_existing = len(game_links) + scraping_status['existing_games']
-            scraping_status['total_games'] = total_with_existing
-            socketio_instance.emit('scraping_update', scraping_status)
+            # Total includes games already in the database
+            total_with_existing = len(game_links) + scraping_state.existing_games
+            update_scraping_state(total_games=total_with_existing, scraped_count=0)
+            self._emit_update(socketio_instance, force=True)
             
             if len(game_links) == 0:
-                scraping_status['is_active'] = False
-                scraping_status['status_message'] = 'No new games found to scrape.'
-                socketio_instance.emit('scraping_update', scraping_status)
+                update_scraping_state(is_active=False,
+                                      status_message='No new games found to scrape.')
+                self._emit_update(socketio_instance, force=True)
                 logger.warning("No game links found")
                 return
             
-            # Start scraping individual games
-            for i, link in enumerate(game_links):
-                if not scraping_status['is_active']:  # Check if user stopped
-                    logger.info("Scraping stopped by user")
-                    break
-                    
-                scraping_status['current_game'] = f"Game {i+1} of {len(game_links)}"
-                scraping_status['progress'] = int((i / len(game_links)) * 100)
-                scraping_status['scraped_count'] = i
-                scraping_status['status_message'] = f'Scraping: {scraping_status["current_game"]}'
-                
-                # Emit update
-                socketio_instance.emit('scraping_update', scraping_status)
-                logger.info(f"Scraping game {i+1}/{len(game_links)}: {link}")
-                
-                # Scrape the game
-                result = self.scraper.scrape_game_details(link)
-                if result:
-                    logger.info(f"Successfully scraped: {result.get('name', 'Unknown')}")
-                else:
-                    logger.warning(f"Failed to scrape: {link}")
-                    
-                time.sleep(1)  # Small delay to prevent overwhelming
-                
-            scraping_status['is_active'] = False
-            scraping_status['status_message'] = f'Completed! Scraped {len(game_links)} games.'
-            scraping_status['progress'] = 100
-            socketio_instance.emit('scraping_update', scraping_status)
+            # Migrate the target database up front: the scrape below holds
+            # the pool's single write connection for its whole duration,
+            # so a migration attempted mid-scrape would block on it
+            ensure_schema_upgrades(db_name)
+
+            # Hold one pooled write connection for the whole run and batch
+            # commits across games so each insert is not its own fsync
+            with db_pool.acquire(db_name, write=True) as write_conn:
+                self.scraper.set_connection(write_conn)
+                self.scraper.commit_every = self.COMMIT_EVERY
+
+                # Scrape games concurrently; the work is network-bound, so a
+                # bounded thread pool overlaps the request waits
+                with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                    futures = {executor.submit(self.scraper.scrape_game_details, link): link
+                               for link in game_links}
+                    done_count = 0
+                    failed_count = 0
+                    for future in as_completed(futures):
+                        if stop_event.is_set():  # Check if user stopped
+                            logger.info("Scraping stopped by user")
+                            for pending in futures:
+                                pending.cancel()
+                            break
+
+                        link = futures[future]
+                        done_count += 1
+                        current_game = f"Game {done_count} of {len(game_links)}"
+                        update_scraping_state(
+                            current_game=current_game,
+                            progress=int((done_count / len(game_links)) * 100),
+                            scraped_count=done_count,
+                            status_message=f'Scraping: {current_game}')
+
+                        # Emit update, coalesced to the throttle interval
+                        self._emit_update(socketio_instance, force=(done_count == len(game_links)))
+
+                        result = future.exception() is None and future.result()
+                        if result:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug('Successfully scraped: %s', result.get('name', 'Unknown'))
+                        else:
+                            failed_count += 1
+                            logger.warning('Failed to scrape: %s', link)
+
+                self.scraper.flush()
+                logger.info('Scraped %d/%d games (%d failed)',
+                            done_count - failed_count, len(game_links), failed_count)
+
+
+            update_scraping_state(is_active=False, progress=100,
+                                  status_message=f'Completed! Scraped {len(game_links)} games.')
+            self._emit_update(socketio_instance, force=True)
+            refresh_valid_databases()
             logger.info("Scraping completed successfully")
-            
+
         except Exception as e:
-            scraping_status['is_active'] = False
-            scraping_status['status_message'] = f'Error: {str(e)}'
-            socketio_instance.emit('scraping_update', scraping_status)
+            update_scraping_state(is_active=False, status_message=f'Error: {str(e)}')
+            self._emit_update(socketio_instance, force=True)
             logger.error(f"Scraping error: {e}", exc_info=True)
         finally:
             if self.scraper:
@@ -204,33 +437,81 @@ def index():
     """Main page with both scraper and search functionality"""
     return render_template('index.html')
 
+# Known-good database files; endpoints check membership instead of
+# stat'ing the filesystem per request. Only names discovered by the
+# directory scan are ever admitted, so request-supplied paths cannot
+# escape the working directory.
+_valid_dbs = set()
+_valid_dbs_lock = threading.Lock()
+
+def refresh_valid_databases():
+    """Rescan the working directory for database files"""
+    found = set(glob.glob('*.db'))
+    with _valid_dbs_lock:
+        stale = _valid_dbs - found
+        _valid_dbs.clear()
+        _valid_dbs.update(found)
+    # Databases that vanished may be recreated under the same name later;
+    # drop their pooled connections and cached state so we never serve the
+    # old inode or skip migrating the new file
+    for name in stale:
+        db_pool.close_all(name)
+        _db_meta_cache.pop(name, None)
+        _legacy_frame_cache.pop(name, None)
+        with _migrate_lock:
+            _migrated_dbs.discard(name)
+    return found
+
+def _is_valid_db(db_name):
+    """O(1) membership check, rescanning once on a miss for new files"""
+    with _valid_dbs_lock:
+        if db_name in _valid_dbs:
+            return True
+    return db_name in refresh_valid_databases()
+
+# Cached per-database metadata, refreshed only when the file changes;
+# COUNT(*) is a full table scan in SQLite, so polling clients should not
+# trigger one per request
+_db_meta_cache = {}
+
+# The per-file stat+count work is independent I/O, so fan it out
+_meta_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='db-meta')
+
+def _database_info(db_file):
+    """Build (or reuse cached) metadata for one database file"""
+    key = _db_file_key(db_file)
+    cached = _db_meta_cache.get(db_file)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    try:
+        with db_pool.acquire(db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM games")
+            count = cursor.fetchone()[0]
+
+        # Get file size
+        size = os.path.getsize(db_file) / (1024 * 1024)  # MB
+    except Exception as e:
+        logger.error(f"Error reading database {db_file}: {e}")
+        return None
+
+    info = {
+        'filename': db_file,
+        'name': db_file.replace('.db', '').replace('_', ' ').title(),
+        'game_count': count,
+        'size_mb': round(size, 1)
+    }
+    _db_meta_cache[db_file] = (key, info)
+    return info
+
 @app.route('/api/databases')
 def get_databases():
     """Get list of available database files"""
     try:
-        db_files = glob.glob('*.db')
-        databases = []
-        
-        for db_file in db_files:
-            try:
-                conn = sqlite3.connect(db_file)
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM games")
-                count = cursor.fetchone()[0]
-                conn.close()
-                
-                # Get file size
-                size = os.path.getsize(db_file) / (1024 * 1024)  # MB
-                
-                databases.append({
-                    'filename': db_file,
-                    'name': db_file.replace('.db', '').replace('_', ' ').title(),
-                    'game_count': count,
-                    'size_mb': round(size, 1)
-                })
-            except Exception as e:
-                logger.error(f"Error reading database {db_file}: {e}")
-                
+        db_files = sorted(refresh_valid_databases())
+        databases = [info for info in _meta_executor.map(_database_info, db_files)
+                     if info is not None]
         return jsonify(databases)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -244,42 +525,118 @@ def search_games():
         start_date = data.get('start_date')
         end_date = data.get('end_date')
         
-        if not db_name or not os.path.exists(db_name):
+        if not db_name or not _is_valid_db(db_name):
             return jsonify({'error': 'Database not found'}), 400
             
-        conn = sqlite3.connect(db_name)
-        cursor = conn.cursor()
-        
-        # Get all games and filter by date
-        cursor.execute('SELECT app_id, name, developer, publisher, release_date, price FROM games')
-        all_games = cursor.fetchall()
-        
-        logger.info(f"Filtering games between {start_date} and {end_date}")
-        
-        filtered_games = []
-        for game in all_games:
-            release_date = game[4]
-            if release_date and is_steam_date_in_range(release_date, start_date, end_date):
-                logger.info(f"Including game: {game[1]} with date: {release_date}")
-                filtered_games.append({
-                    'app_id': game[0],
-                    'name': game[1],
-                    'developer': game[2],
-                    'publisher': game[3],
-                    'release_date': game[4],
-                    'price': game[5]
-                })
-            else:
-                if release_date and release_date != 'Unknown':
-                    logger.debug(f"Excluding game: {game[1]} with date: {release_date}")
-        
-        conn.close()
+        ensure_schema_upgrades(db_name)
+
+        start_ts = int(datetime.strptime(start_date, "%Y-%m-%d").timestamp())
+        end_ts = int(datetime.strptime(end_date, "%Y-%m-%d").timestamp())
+
+        with db_pool.acquire(db_name) as conn:
+            cursor = conn.cursor()
+            # Row objects convert straight to dicts, no per-column indexing
+            cursor.row_factory = sqlite3.Row
+
+            # Let SQLite serve the range query from the index
+            cursor.execute('''
+                SELECT app_id, name, developer, publisher, release_date, price
+                FROM games
+                WHERE release_dt_end >= ? AND release_dt_start <= ?
+            ''', (start_ts, end_ts))
+            matched_games = cursor.fetchall()
+
+        filtered_games = [dict(row) for row in matched_games]
+
+        # Rows without normalised bounds are filtered with a vectorised mask
+        # over the cached parsed frame
+        legacy_df = _legacy_rows_frame(db_name)
+        if len(legacy_df):
+            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
+            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            mask = (legacy_df['end_dt'] >= start_dt) & (legacy_df['start_dt'] <= end_dt)
+            matched = legacy_df.loc[mask, ['app_id', 'name', 'developer', 'publisher', 'release_date', 'price']]
+            filtered_games.extend(json.loads(matched.to_json(orient='records')))
+
+        logger.info('Filter kept %d games between %s and %s',
+                    len(filtered_games), start_date, end_date)
         return jsonify(filtered_games)
         
     except Exception as e:
         logger.error(f"Search error: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _stream_csv(db_name, query, params=(), setup=None):
+    """Yield CSV chunks for a query, streaming rows straight off the cursor"""
+    import csv
+    import io
+    with db_pool.acquire(db_name) as conn:
+        if setup:
+            setup(conn)
+        cursor = conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(columns)
+        yield buf.getvalue()
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows(rows)
+            yield buf.getvalue()
+
+def _stream_json(db_name, query, params=(), setup=None):
+    """Yield a JSON array for a query one row at a time"""
+    with db_pool.acquire(db_name) as conn:
+        if setup:
+            setup(conn)
+        cursor = conn.cursor()
+        cursor.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        yield '['
+        first = True
+        for row in cursor:
+            prefix = '\n' if first else ',\n'
+            first = False
+            yield prefix + _dumps(dict(zip(columns, row)))
+        yield '\n]'
+
+def _write_excel(db_name, query, params=(), setup=None):
+    """Build an xlsx export with xlsxwriter in constant-memory mode.
+
+    Rows stream from the cursor straight into the workbook writer, so
+    only the final assembled file is held in memory.
+    """
+    import io
+    import xlsxwriter
+    with db_pool.acquire(db_name) as conn:
+        if setup:
+            setup(conn)
+        cursor = conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute(query, params)
+        columns = [description[0] for description in cursor.description]
+
+        output = io.BytesIO()
+        workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, columns)
+        row_no = 1
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for row in rows:
+                worksheet.write_row(row_no, 0, row)
+                row_no += 1
+        workbook.close()
+    return output.getvalue()
+
 @app.route('/api/export_database', methods=['POST'])
 def export_database():
     """Export entire database to file and serve as download"""
@@ -289,63 +646,38 @@ def export_database():
         format_type = data.get('format', 'csv')
         filename = data.get('filename', 'database_export')
         
-        if not db_name or not os.path.exists(db_name):
+        if not db_name or not _is_valid_db(db_name):
             return jsonify({'error': 'Database not found'}), 400
             
-        conn = sqlite3.connect(db_name)
-        cursor = conn.cursor()
-        
-        # Get all games with tags
-        cursor.execute('''
-            SELECT g.*, GROUP_CONCAT(DISTINCT t.tag) as tags
+        ensure_schema_upgrades(db_name)
+
+        # Export all games with tags
+        query = f'''
+            SELECT {_EXPORT_COLUMNS}, GROUP_CONCAT(t.tag) as tags
             FROM games g
             LEFT JOIN tags t ON g.app_id = t.app_id
             GROUP BY g.app_id
-        ''')
-        games = cursor.fetchall()
-        
-        # Get column names
-        columns = [description[0] for description in cursor.description]
-        
-        conn.close()
-        
-        # Create file in memory and return as download
+        '''
+
+        # Stream rows straight from the cursor into the response
         if format_type == 'csv':
-            import csv
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            writer.writerows(games)
-            
-            response = make_response(output.getvalue())
-            response.headers['Content-Type'] = 'text/csv'
+            response = Response(stream_with_context(_stream_csv(db_name, query)),
+                                mimetype='text/csv')
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
             return response
-                
+
         elif format_type == 'json':
-            json_data = []
-            for row in games:
-                json_data.append(dict(zip(columns, row)))
-            
-            response = make_response(json.dumps(json_data, indent=2, ensure_ascii=False))
-            response.headers['Content-Type'] = 'application/json'
+            response = Response(stream_with_context(_stream_json(db_name, query)),
+                                mimetype='application/json')
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.json"'
             return response
-                
+
         elif format_type == 'excel':
-            import pandas as pd
-            import io
-            output = io.BytesIO()
-            df = pd.DataFrame(games, columns=columns)
-            df.to_excel(output, index=False, engine='openpyxl')
-            output.seek(0)
-            
-            response = make_response(output.getvalue())
+            response = make_response(_write_excel(db_name, query))
             response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
             return response
-        
+
     except Exception as e:
         logger.error(f"Database export error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -360,114 +692,108 @@ def export_search_results():
         format_type = data.get('format', 'csv')
         filename = data.get('filename', 'search_results')
         
-        if not db_name or not os.path.exists(db_name):
+        if not db_name or not _is_valid_db(db_name):
             return jsonify({'error': 'Database not found'}), 400
             
         if not app_ids:
             return jsonify({'error': 'No games to export'}), 400
             
-        conn = sqlite3.connect(db_name)
-        cursor = conn.cursor()
-        
-        # Get complete data for these games with tags
-        placeholders = ','.join('?' * len(app_ids))
+        ensure_schema_upgrades(db_name)
+
+        # Load the requested ids into a temp table and join against it; a
+        # bound IN (...) list hits SQLITE_MAX_VARIABLE_NUMBER for large
+        # selections and re-plans a huge expression every call
+        def load_ids(conn):
+            conn.execute('DROP TABLE IF EXISTS temp.export_ids')
+            conn.execute('CREATE TEMP TABLE export_ids(app_id INTEGER PRIMARY KEY)')
+            conn.executemany('INSERT OR IGNORE INTO export_ids VALUES (?)',
+                             ((app_id,) for app_id in app_ids))
+
         query = f'''
-            SELECT g.*, GROUP_CONCAT(DISTINCT t.tag) as tags
+            SELECT {_EXPORT_COLUMNS}, GROUP_CONCAT(t.tag) as tags
             FROM games g
+            JOIN export_ids e ON g.app_id = e.app_id
             LEFT JOIN tags t ON g.app_id = t.app_id
-            WHERE g.app_id IN ({placeholders})
             GROUP BY g.app_id
         '''
-        
-        cursor.execute(query, app_ids)
-        games = cursor.fetchall()
-        
-        # Get column names
-        columns = [description[0] for description in cursor.description]
-        
-        conn.close()
-        
-        # Create file in memory and return as download
+
+        # Stream rows straight from the cursor into the response
         if format_type == 'csv':
-            import csv
-            import io
-            output = io.StringIO()
-            writer = csv.writer(output)
-            writer.writerow(columns)
-            writer.writerows(games)
-            
-            response = make_response(output.getvalue())
-            response.headers['Content-Type'] = 'text/csv'
+            response = Response(stream_with_context(_stream_csv(db_name, query, setup=load_ids)),
+                                mimetype='text/csv')
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
             return response
-                
+
         elif format_type == 'json':
-            json_data = []
-            for row in games:
-                json_data.append(dict(zip(columns, row)))
-            
-            response = make_response(json.dumps(json_data, indent=2, ensure_ascii=False))
-            response.headers['Content-Type'] = 'application/json'
+            response = Response(stream_with_context(_stream_json(db_name, query, setup=load_ids)),
+                                mimetype='application/json')
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.json"'
             return response
-                
+
         elif format_type == 'excel':
-            import pandas as pd
-            import io
-            output = io.BytesIO()
-            df = pd.DataFrame(games, columns=columns)
-            df.to_excel(output, index=False, engine='openpyxl')
-            output.seek(0)
-            
-            response = make_response(output.getvalue())
+            response = make_response(_write_excel(db_name, query, setup=load_ids))
             response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             response.headers['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
             return response
-        
+
     except Exception as e:
         logger.error(f"Search results export error: {e}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/export_games', methods=['POST'])
 def export_games():
-    """Export search results to file"""
+    """Export client-supplied search results as a direct download"""
     try:
         data = request.json
         games = data.get('games', [])
         format_type = data.get('format', 'csv')
         filename = data.get('filename', 'search_results')
-        
+
         if not games:
             return jsonify({'error': 'No games to export'}), 400
-            
-        # Prepare data for export
-        output_path = f"{filename}.csv"  # Default to CSV
-        
+
+        # Stream straight into the response instead of writing a server-side
+        # file the client would have to fetch in a second round trip
         if format_type == 'csv':
-            import csv
-            output_path = f"{filename}.csv"
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
+            def generate():
+                import csv
+                import io
+                buf = io.StringIO()
+                writer = csv.writer(buf)
                 writer.writerow(['App ID', 'Name', 'Developer', 'Publisher', 'Release Date', 'Price'])
+                yield buf.getvalue()
                 for game in games:
+                    buf.seek(0)
+                    buf.truncate()
                     writer.writerow([
-                        game['app_id'], game['name'], game['developer'], 
+                        game['app_id'], game['name'], game['developer'],
                         game['publisher'], game['release_date'], game['price']
                     ])
-                    
+                    yield buf.getvalue()
+
+            response = Response(stream_with_context(generate()), mimetype='text/csv')
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}.csv"'
+            return response
+
         elif format_type == 'json':
-            output_path = f"{filename}.json"
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(games, f, indent=2, ensure_ascii=False)
-                
+            response = make_response(_dumps(games))
+            response.headers['Content-Type'] = 'application/json'
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}.json"'
+            return response
+
         elif format_type == 'excel':
             import pandas as pd
-            output_path = f"{filename}.xlsx"
+            import io
+            output = io.BytesIO()
             df = pd.DataFrame(games)
-            df.to_excel(output_path, index=False, engine='openpyxl')
-            
-        return jsonify({'message': f'Successfully exported to {output_path}', 'filename': output_path})
-        
+            df.to_excel(output, index=False, engine='xlsxwriter')
+            output.seek(0)
+
+            response = make_response(output.getvalue())
+            response.headers['Content-Type'] = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}.xlsx"'
+            return response
+
     except Exception as e:
         logger.error(f"Export error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -475,11 +801,9 @@ def export_games():
 @socketio.on('start_scraping')
 def handle_start_scraping(data):
     """Handle scraping start request"""
-    global scraping_status
-    
     logger.info(f"Received start_scraping request with data: {data}")
-    
-    if scraping_status['is_active']:
+
+    if scraping_state.is_active:
         logger.warning("Scraping already in progress")
         emit('error', {'message': 'Scraping is already in progress'})
         return
@@ -503,31 +827,28 @@ def handle_start_scraping(data):
     if not db_name.endswith('.db'):
         db_name = f"{db_name}.db"
     
-    logger.info(f"Starting scraping thread for URL: {url}, DB: {db_name}")
-    
-    # Start scraping in a separate thread
-    thread = threading.Thread(
-        target=web_scraper.start_scraping, 
-        args=(url, db_name, socketio)
-    )
-    thread.daemon = True
-    thread.start()
-    
-    logger.info("Scraping thread started successfully")
+    logger.info(f"Starting scraping task for URL: {url}, DB: {db_name}")
+
+    # Run the scrape as a Socket.IO background task so it cooperates with
+    # the server's async mode (gevent greenlet or plain thread); progress
+    # goes back to this client's own room only
+    socketio.start_background_task(web_scraper.start_scraping, url, db_name,
+                                   socketio, request.sid)
+
+    logger.info("Scraping task started successfully")
 
 @socketio.on('stop_scraping')
 def handle_stop_scraping():
     """Handle scraping stop request"""
-    global scraping_status
-    scraping_status['is_active'] = False
-    scraping_status['status_message'] = 'Stopping...'
-    emit('scraping_update', scraping_status)
+    stop_event.set()
+    state = update_scraping_state(is_active=False, status_message='Stopping...')
+    emit('scraping_update', asdict(state))
 
 @socketio.on('connect')
 def handle_connect():
     """Handle client connection"""
     logger.info("Client connected to Socket.IO")
-    emit('scraping_update', scraping_status)
+    emit('scraping_update', asdict(scraping_state))
 
 @socketio.on('disconnect')
 def handle_disconnect():
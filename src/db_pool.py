@@ -0,0 +1,80 @@
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+# Number of pooled read connections kept per database file
+READ_POOL_SIZE = max(4, os.cpu_count() or 1)
+
+_lock = threading.Lock()
+_read_pools = {}    # db_name -> LifoQueue of reusable read connections
+_write_pools = {}   # db_name -> LifoQueue holding the single write connection
+_write_created = set()
+
+
+def _new_connection(db_name):
+    """Open a tuned SQLite connection suitable for pooling"""
+    conn = sqlite3.connect(db_name, check_same_thread=False, isolation_level=None)
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA cache_size=-20000')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.close()
+    return conn
+
+
+def _get_pool(pools, db_name, size):
+    with _lock:
+        pool = pools.get(db_name)
+        if pool is None:
+            pool = queue.LifoQueue(maxsize=size)
+            pools[db_name] = pool
+        return pool
+
+
+@contextmanager
+def acquire(db_name, write=False):
+    """Borrow a pooled connection for db_name and return it on exit.
+
+    Readers share a bounded LIFO pool (extra connections are created on
+    demand and discarded when the pool is full). Writers share a single
+    connection so SQLite never sees competing writers.
+    """
+    if write:
+        pool = _get_pool(_write_pools, db_name, 1)
+        with _lock:
+            if db_name not in _write_created:
+                pool.put(_new_connection(db_name))
+                _write_created.add(db_name)
+        conn = pool.get()  # blocks until the single writer is free
+    else:
+        pool = _get_pool(_read_pools, db_name, READ_POOL_SIZE)
+        try:
+            conn = pool.get_nowait()
+        except queue.Empty:
+            conn = _new_connection(db_name)
+
+    try:
+        yield conn
+    finally:
+        try:
+            pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+def close_all(db_name=None):
+    """Close pooled connections for one database (or all of them)"""
+    with _lock:
+        names = [db_name] if db_name else set(_read_pools) | set(_write_pools)
+        for name in names:
+            for pools in (_read_pools, _write_pools):
+                pool = pools.pop(name, None)
+                while pool is not None:
+                    try:
+                        pool.get_nowait().close()
+                    except queue.Empty:
+                        break
+            _write_created.discard(name)
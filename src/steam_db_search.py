@@ -3,10 +3,14 @@ from tkinter import ttk, messagebox, filedialog
 from tkcalendar import DateEntry
 import sqlite3
 import pandas as pd
+import xlsxwriter
 import json
 import csv
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+import functools
 import logging
+import weakref
 import re
 import os
 
@@ -19,82 +23,134 @@ logging.basicConfig(
     ]
 )
 
+# One anchored alternation covers every Steam date shape; the matching
+# group name selects the strptime format, so the regex engine runs at
+# most once per string. Vague shapes ("2025", "Q1 2025") simply fail to
+# match and need no separate probes.
+_DATE_SHAPES = re.compile(
+    r'^(?:'
+    r'(?P<dmy>\d{1,2}\s+[A-Za-z]{3},\s+\d{4})'      # "16 Oct, 2025"
+    r'|(?P<mdy>[A-Za-z]{3}\s+\d{1,2},\s+\d{4})'     # "Oct 16, 2025"
+    r'|(?P<full>[A-Za-z]+\s+\d{1,2},\s+\d{4})'      # "October 16, 2025"
+    r'|(?P<month_only>[A-Za-z]+\s+\d{4})'             # "October 2025"
+    r')$'
+)
+_SHAPE_FORMATS = {'dmy': "%d %b, %Y", 'mdy': "%b %d, %Y", 'full': "%B %d, %Y"}
+
+_MONTHS = {month: i for i, month in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'), 1)}
+_RE_MONTH_YEAR = re.compile(r'^[A-Za-z]+\s+\d{4}$')
+
+# Date strings too vague to place in a range
+_VAGUE_DATES = frozenset({'', 'Unknown', 'TBA', 'TBD', 'Coming Soon'})
+
 def parse_steam_date_to_comparable(date_str):
     """Parse Steam date to a comparable date, return None if too vague"""
-    if not date_str or date_str.strip() in ['Unknown', 'TBA', 'TBD', 'Coming Soon']:
-        return None
-        
-    date_str = date_str.strip()
-    
-    # Skip vague dates immediately
-    if re.match(r'^\d{4}$', date_str):  # Just year like "2025"
+    if not date_str:
         return None
-    if re.match(r'Q[1-4]\s+\d{4}', date_str):  # Quarter like "Q1 2025"
+    return _parse_stripped_date(date_str.strip())
+
+@functools.lru_cache(maxsize=4096)
+def _parse_stripped_date(date_str):
+    """Parse an already-stripped Steam date string.
+
+    Release date strings repeat heavily across a database, so results are
+    memoized. Callers that have already stripped should call this directly
+    to avoid re-stripping per row.
+    """
+    if date_str in _VAGUE_DATES:
         return None
-    
+
     try:
-        # Handle "16 Oct, 2025" format - SPECIFIC DATE
-        if re.match(r'\d{1,2}\s+\w{3},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%d %b, %Y")
-            
-        # Handle "Oct 16, 2025" format - SPECIFIC DATE
-        if re.match(r'\w{3}\s+\d{1,2},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%b %d, %Y")
-            
-        # Handle "October 16, 2025" format - SPECIFIC DATE
-        if re.match(r'\w+\s+\d{1,2},\s+\d{4}', date_str):
-            return datetime.strptime(date_str, "%B %d, %Y")
+        # Fast path: the dominant "16 Oct, 2025" shape is recognisable from
+        # two cheap character probes, and slicing plus a month lookup is
+        # several times faster than strptime's pure-Python format machinery
+        if len(date_str) >= 11 and date_str[0].isdigit() and ',' in date_str[1:7]:
+            try:
+                first_space = date_str.index(' ')
+                month = _MONTHS[date_str[first_space + 1:first_space + 4]]
+                return datetime(int(date_str[-4:]), month, int(date_str[:first_space]))
+            except (KeyError, ValueError):
+                pass  # unusual shape; fall back to the regex dispatch
+
+        m = _DATE_SHAPES.match(date_str)
+        if not m:
+            return None
 
-        # Handle "October 2025" format - MONTH AND YEAR (use first day)
-        if re.match(r'^\w+\s+\d{4}$', date_str):
+        kind = m.lastgroup
+        if kind == 'month_only':
+            # Month and year only (use first day)
             try:
                 return datetime.strptime(date_str, "%B %Y")
             except ValueError:
                 return datetime.strptime(date_str, "%b %Y")
+        return datetime.strptime(date_str, _SHAPE_FORMATS[kind])
 
-        return None
-        
     except Exception as e:
         logging.error(f"Date parsing error for '{date_str}': {e}")
         return None
 
+@functools.lru_cache(maxsize=4096)
+def _is_month_only(date_str):
+    """True for month-and-year dates like "October 2025" """
+    return bool(_RE_MONTH_YEAR.match(date_str))
+
+@functools.lru_cache(maxsize=4096)
+def _date_ordinals(date_str):
+    """(start, end) day ordinals for a date string, or None if too vague.
+
+    Month-only dates span the whole month. Plain int comparisons on these
+    are an order of magnitude cheaper than datetime.__le__ per row.
+    """
+    release_dt = _parse_stripped_date(date_str)
+    if not release_dt:
+        return None
+    if _is_month_only(date_str):
+        month_start = release_dt.replace(day=1)
+        if release_dt.month == 12:
+            next_month = release_dt.replace(year=release_dt.year + 1, month=1, day=1)
+        else:
+            next_month = release_dt.replace(month=release_dt.month + 1, day=1)
+        return month_start.toordinal(), next_month.toordinal() - 1
+    ordinal = release_dt.toordinal()
+    return ordinal, ordinal
+
+def _date_in_range(bounds, start_ord, end_ord):
+    """Branchless range-overlap test on precomputed day ordinals.
+
+    Callers filtering many rows should convert start/end to ordinals once
+    and call this directly instead of re-parsing them per row.
+    """
+    return bounds[1] >= start_ord and bounds[0] <= end_ord
+
 def is_steam_date_in_range(release_date, start_date_str, end_date_str):
     """Simple, robust date range checking"""
-    release_dt = parse_steam_date_to_comparable(release_date)
-    
-    if not release_dt:
+    if not release_date:
         return False
-        
+
+    bounds = _date_ordinals(release_date.strip())
+    if not bounds:
+        return False
+
     try:
-        start_dt = datetime.strptime(start_date_str, "%Y-%m-%d")
-        end_dt = datetime.strptime(end_date_str, "%Y-%m-%d")
-        
-        # Check if it's a month-only date (like "October 2025")
-        original_date = release_date.strip()
-        month_patterns = [r'^\w+\s+\d{4}$']  # "October 2025" or "Oct 2025"
-        
-        is_month_only = any(re.match(pattern, original_date) for pattern in month_patterns)
-        
-        if is_month_only:
-            # For month-only dates, check if the ENTIRE month overlaps with the range
-            month_start = release_dt.replace(day=1)
-            # Get last day of the month
-            if release_dt.month == 12:
-                month_end = release_dt.replace(year=release_dt.year + 1, month=1, day=1) - timedelta(days=1)
-            else:
-                month_end = release_dt.replace(month=release_dt.month + 1, day=1) - timedelta(days=1)
-            
-            # Check if ANY part of the month overlaps with the search range
-            return not (month_end < start_dt or month_start > end_dt)
-        else:
-            # For specific dates, simple comparison
-            return start_dt <= release_dt <= end_dt
-            
+        start_ord = datetime.strptime(start_date_str, "%Y-%m-%d").toordinal()
+        end_ord = datetime.strptime(end_date_str, "%Y-%m-%d").toordinal()
+        return _date_in_range(bounds, start_ord, end_ord)
     except Exception as e:
         logging.error(f"Date comparison error for '{release_date}': {e}")
         return False
 
 class SteamDBSearch:
+    # Rows inserted into the Treeview per batch; Tk widgets are not built
+    # for tens of thousands of items, so the rest sits behind "Show More"
+    DISPLAY_BATCH = 1000
+
+    # One shared connection per database file; reconnecting would only
+    # re-apply pragmas and re-run WAL checkpoints
+    _POOL = {}
+    _MIGRATED = set()
+
     def __init__(self, root):
         self.root = root
         self.root.title("Steam Games Database Search")
@@ -102,25 +158,136 @@ class SteamDBSearch:
         # Database connection
         self.db_path = None
         self.db_conn = None
-        
+
+        # Full search results (the Treeview may only show a prefix)
+        self.search_results = []
+        self._display_offset = 0
+
+        # Searches run off the Tk thread so the UI stays responsive
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+        # __del__ is unreliable (GC-order dependent); finalize runs once
+        # when the instance goes away
+        weakref.finalize(self, SteamDBSearch._close_pool)
+
         self.create_widgets()
         
     def connect_db(self, db_path):
-        """Connect to the SQLite database"""
+        """Connect to the SQLite database, reusing pooled connections"""
         try:
-            # Close existing connection if any
-            if self.db_conn:
-                self.db_conn.close()
-                
-            self.db_conn = sqlite3.connect(db_path)
+            conn = self._POOL.get(db_path)
+            if conn is None:
+                # A larger statement cache keeps the repeated search/export
+                # queries prepared across calls
+                conn = sqlite3.connect(db_path, cached_statements=256)
+                cursor = conn.cursor()
+                cursor.execute('PRAGMA journal_mode=WAL')
+                cursor.execute('PRAGMA synchronous=NORMAL')
+                cursor.execute('PRAGMA temp_store=MEMORY')
+                cursor.execute('PRAGMA mmap_size=268435456')
+                self._POOL[db_path] = conn
+
+            self.db_conn = conn
             self.db_path = db_path
+            if db_path not in self._MIGRATED:
+                self._ensure_release_date_index()
+                self._MIGRATED.add(db_path)
             logging.info(f"Connected to database: {db_path}")
             return True
         except sqlite3.Error as e:
             logging.error(f"Database connection error: {e}")
             messagebox.showerror("Error", f"Database connection error: {e}")
             return False
-        
+
+    @classmethod
+    def _close_pool(cls):
+        """Close every pooled connection"""
+        for conn in cls._POOL.values():
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        cls._POOL.clear()
+        cls._MIGRATED.clear()
+
+    def _ensure_release_date_index(self):
+        """Add and backfill the indexed release_date_iso/precision columns.
+
+        Parsing happens once per row here instead of on every search, so
+        the date filter can run inside SQLite over an index. Vague dates
+        stay NULL and are skipped by the SQL filter.
+        """
+        cursor = self.db_conn.cursor()
+        columns = {row[1] for row in cursor.execute('PRAGMA table_info(games)')}
+        if 'release_date_iso' not in columns:
+            cursor.execute('ALTER TABLE games ADD COLUMN release_date_iso TEXT')
+            cursor.execute('ALTER TABLE games ADD COLUMN release_date_precision TEXT')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_release_iso ON games(release_date_iso)')
+
+        # Covering index matching the search SELECT list, so the range
+        # query is answered from the index without per-row table fetches
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_games_cover ON games(
+                release_date_iso, release_date_precision, app_id, name,
+                developer, publisher, release_date, price)
+        ''')
+
+        cursor.execute('''
+            SELECT app_id, release_date FROM games
+            WHERE release_date_iso IS NULL AND release_date IS NOT NULL
+        ''')
+        updates = []
+        for app_id, release_date in cursor.fetchall():
+            parsed = parse_steam_date_to_comparable(release_date)
+            if parsed is None:
+                continue
+            precision = 'month' if _is_month_only(release_date.strip()) else 'day'
+            updates.append((parsed.strftime('%Y-%m-%d'), precision, app_id))
+        if updates:
+            cursor.executemany(
+                'UPDATE games SET release_date_iso = ?, release_date_precision = ? WHERE app_id = ?',
+                updates
+            )
+        # Tag lookups in the export join are answered from a covering
+        # index; uniqueness makes GROUP_CONCAT's DISTINCT unnecessary
+        cursor.execute('''
+            DELETE FROM tags WHERE id NOT IN
+                (SELECT MIN(id) FROM tags GROUP BY app_id, tag)
+        ''')
+        cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_tags_app_tag ON tags(app_id, tag)')
+
+        # Refresh planner statistics so the new indexes actually get used
+        cursor.execute('ANALYZE')
+        self.db_conn.commit()
+
+    def _filter_legacy_rows(self, start_date, end_date, conn=None):
+        """Vectorised date filter for rows not yet normalised in SQL.
+
+        The whole release_date column is parsed with bulk pd.to_datetime
+        passes (day formats plus a month-only pass spanning the month) and
+        filtered with a boolean mask instead of per-row strptime calls.
+        """
+        df = pd.read_sql_query(
+            'SELECT app_id, name, developer, publisher, release_date, price '
+            'FROM games WHERE release_date_iso IS NULL', conn or self.db_conn)
+        if df.empty:
+            return []
+
+        dates = df['release_date'].fillna('').str.strip()
+        day = pd.to_datetime(dates, format='%d %b, %Y', errors='coerce')
+        for fmt in ('%b %d, %Y', '%B %d, %Y'):
+            day = day.fillna(pd.to_datetime(dates, format=fmt, errors='coerce'))
+
+        # Month-only dates span the entire month
+        month_only = dates.where(dates.str.match(r'^[A-Za-z]+\s+\d{4}$'))
+        month = pd.to_datetime(month_only, format='%B %Y', errors='coerce')
+        month = month.fillna(pd.to_datetime(month_only, format='%b %Y', errors='coerce'))
+
+        start_bound = day.fillna(month)
+        end_bound = day.fillna(month + pd.offsets.MonthEnd(0))
+        mask = (end_bound >= pd.Timestamp(start_date)) & (start_bound <= pd.Timestamp(end_date))
+        return list(df.loc[mask].itertuples(index=False, name=None))
+
     def create_widgets(self):
         # Database Selection Frame
         db_frame = ttk.LabelFrame(self.root, text="Select Database", padding="10")
@@ -171,6 +338,10 @@ class SteamDBSearch:
         ttk.Radiobutton(export_frame, text="Excel", variable=self.export_format, value="excel").grid(row=0, column=2, padx=5, pady=5)
         
         ttk.Button(export_frame, text="Export Selected Format", command=self.export_results).grid(row=0, column=3, padx=10, pady=5)
+
+        self.show_more_btn = ttk.Button(export_frame, text="Show More Results",
+                                        command=self.show_more_results, state="disabled")
+        self.show_more_btn.grid(row=0, column=4, padx=10, pady=5)
         
         # Status Bar
         self.status_var = tk.StringVar(value="Ready")
@@ -179,12 +350,25 @@ class SteamDBSearch:
     
     def refresh_available_databases(self):
         """Scan the current directory for SQLite database files"""
+        # Creating/removing files bumps the directory mtime, so an
+        # unchanged mtime means the button list is already current
+        try:
+            dir_mtime = os.stat('.').st_mtime
+        except OSError:
+            dir_mtime = None
+        if dir_mtime is not None and dir_mtime == getattr(self, '_db_dir_mtime', None):
+            return
+        self._db_dir_mtime = dir_mtime
+
         # Clear existing buttons
         for widget in self.db_buttons_frame.winfo_children():
             widget.destroy()
             
-        # Find all .db files in the current directory
-        db_files = [f for f in os.listdir('.') if f.endswith('.db')]
+        # Find all .db files in the current directory; scandir gives
+        # DirEntry objects with cached stat info
+        with os.scandir('.') as entries:
+            db_files = sorted(e.name for e in entries
+                              if e.is_file() and e.name.endswith('.db'))
         
         if not db_files:
             ttk.Label(self.db_buttons_frame, text="No database files found. Run the scraper first to create databases.").grid(row=0, column=0, padx=5, pady=5)
@@ -261,61 +445,96 @@ class SteamDBSearch:
         if not self.db_conn:
             self.status_var.set("Error: No database connected")
             return
-            
+
+        start_date = self.start_date.get_date().strftime('%Y-%m-%d')
+        end_date = self.end_date.get_date().strftime('%Y-%m-%d')
+
+        # Run the query on a worker; results are marshalled back onto the
+        # Tk thread via root.after
+        self.status_var.set("Searching...")
+        future = self._executor.submit(self._search_worker, self.db_path,
+                                       start_date, end_date)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_search_done, f, start_date, end_date))
+
+    def _search_worker(self, db_path, start_date, end_date):
+        """Run the search query on its own read-only connection"""
+        conn = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
         try:
-            start_date = self.start_date.get_date().strftime('%Y-%m-%d')
-            end_date = self.end_date.get_date().strftime('%Y-%m-%d')
-            
-            cursor = self.db_conn.cursor()
-            cursor.execute('SELECT app_id, name, developer, publisher, release_date, price FROM games')
-            all_games = cursor.fetchall()
-            
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-            
-            # Filter games based on date range using improved logic
-            filtered_games = []
-            excluded_count = 0
-            
-            for game in all_games:
-                app_id, name, dev, pub, release_date, price = game
-                
-                # Use the improved date filtering function
-                if release_date and is_steam_date_in_range(release_date, start_date, end_date):
-                    filtered_games.append(game)
-                    logging.info(f"Including game: {name} with date: {release_date}")
-                else:
-                    excluded_count += 1
-                    if release_date and release_date not in ['Unknown', 'TBA', 'TBD']:
-                        logging.debug(f"Excluding game: {name} with date: {release_date}")
-            
-            # Insert filtered results
-            for row in filtered_games:
-                self.tree.insert('', 'end', values=row)
-            
-            # Enhanced status message
-            total_games = len(all_games)
-            status_msg = f"Found {len(filtered_games)} games (out of {total_games} total)"
-            if excluded_count > 0:
-                status_msg += f". Excluded {excluded_count} games with vague or out-of-range dates."
-            
-            self.status_var.set(status_msg)
-            
-            # Show informative message if no results
-            if len(filtered_games) == 0:
-                messagebox.showinfo(
-                    "No Results", 
-                    f"No games found with release dates between {start_date} and {end_date}.\n\n"
-                    f"Note: Only games with specific dates (e.g., '16 Oct, 2025') or month/year "
-                    f"(e.g., 'October 2025') are included. Vague dates like '2025', 'Q1 2025', "
-                    f"or 'TBA' are excluded from search results."
-                )
-            
+            conn.execute('PRAGMA query_only=1')
+            cursor = conn.cursor()
+
+            # The date filter runs inside SQLite over the indexed ISO
+            # column; month-precision rows match if any part of the month
+            # overlaps the range
+            cursor.execute('''
+                SELECT app_id, name, developer, publisher, release_date, price
+                FROM games
+                WHERE release_date_iso IS NOT NULL
+                  AND release_date_iso <= ?
+                  AND (CASE WHEN release_date_precision = 'month'
+                            THEN date(release_date_iso, '+1 month', '-1 day')
+                            ELSE release_date_iso END) >= ?
+            ''', (end_date, start_date))
+            filtered_games = cursor.fetchall()
+
+            # Rows scraped after the backfill go through the vectorised filter
+            filtered_games.extend(self._filter_legacy_rows(start_date, end_date, conn))
+
+            cursor.execute('SELECT COUNT(*) FROM games')
+            total_games = cursor.fetchone()[0]
+            return filtered_games, total_games
+        finally:
+            conn.close()
+
+    def _on_search_done(self, future, start_date, end_date):
+        """Populate the Treeview with worker results (Tk thread)"""
+        try:
+            filtered_games, total_games = future.result()
         except Exception as e:
             self.status_var.set(f"Search error: {str(e)}")
             logging.error(f"Search error: {e}")
+            return
+
+        # Clear existing items
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        # Keep the full result set for export but only show the first
+        # batch; the rest is loaded on demand
+        self.search_results = filtered_games
+        self._display_offset = 0
+        self.show_more_results()
+
+        # Enhanced status message
+        excluded_count = total_games - len(filtered_games)
+        status_msg = f"Found {len(filtered_games)} games (out of {total_games} total)"
+        if excluded_count > 0:
+            status_msg += f". Excluded {excluded_count} games with vague or out-of-range dates."
+        if len(filtered_games) > self.DISPLAY_BATCH:
+            status_msg += f" Showing first {min(self._display_offset, len(filtered_games))}."
+
+        self.status_var.set(status_msg)
+
+        # Show informative message if no results
+        if len(filtered_games) == 0:
+            messagebox.showinfo(
+                "No Results", 
+                f"No games found with release dates between {start_date} and {end_date}.\n\n"
+                f"Note: Only games with specific dates (e.g., '16 Oct, 2025') or month/year "
+                f"(e.g., 'October 2025') are included. Vague dates like '2025', 'Q1 2025', "
+                f"or 'TBA' are excluded from search results."
+            )
     
+    def show_more_results(self):
+        """Insert the next batch of results into the Treeview"""
+        batch = self.search_results[self._display_offset:self._display_offset + self.DISPLAY_BATCH]
+        for row in batch:
+            self.tree.insert('', 'end', values=row)
+        self._display_offset += len(batch)
+        remaining = len(self.search_results) - self._display_offset
+        self.show_more_btn.configure(state="normal" if remaining > 0 else "disabled")
+
     def export_results(self):
         """Export the search results with ALL fields from database"""
         if not self.db_conn:
@@ -323,7 +542,7 @@ class SteamDBSearch:
             return
             
         try:
-            if not self.tree.get_children():
+            if not self.search_results:
                 self.status_var.set("No results to export")
                 return
                 
@@ -343,43 +562,59 @@ class SteamDBSearch:
             else:
                 output_path = f"{db_name}_{date_range}.{format_type}"
             
-            # Get app_ids from the treeview results
-            app_ids = [self.tree.item(item)['values'][0] for item in self.tree.get_children()]
+            # Export the full result set, not just the rows shown so far
+            app_ids = [row[0] for row in self.search_results]
             
-            # Get complete data for these games from database
+            # Get complete data for these games from database; the ids go
+            # through a temp table instead of a ?-per-id IN list, which
+            # blows past SQLITE_MAX_VARIABLE_NUMBER for big selections
             cursor = self.db_conn.cursor()
-            
-            # Get all fields from games table
-            query = '''
-                SELECT g.*, GROUP_CONCAT(DISTINCT t.tag) as tags
-                FROM games g
-                LEFT JOIN tags t ON g.app_id = t.app_id
-                WHERE g.app_id IN ({})
-                GROUP BY g.app_id
-            '''.format(','.join('?' * len(app_ids)))
-            
-            cursor.execute(query, app_ids)
-            
-            # Get column names
-            columns = [description[0] for description in cursor.description]
-            
-            # Fetch the data
-            results = cursor.fetchall()
-            
-            if format_type == 'csv':
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(columns)  # Write headers
-                    writer.writerows(results)
-            elif format_type == 'json':
-                json_data = []
-                for row in results:
-                    json_data.append(dict(zip(columns, row)))
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2, ensure_ascii=False)
-            elif format_type == 'excel':
-                df = pd.DataFrame(results, columns=columns)
-                df.to_excel(output_path, index=False, engine='openpyxl')
+            cursor.arraysize = 1000
+            cursor.execute('CREATE TEMP TABLE _export_ids(app_id INTEGER PRIMARY KEY)')
+            try:
+                cursor.executemany('INSERT OR IGNORE INTO _export_ids VALUES (?)',
+                                   [(app_id,) for app_id in app_ids])
+
+                # Get all fields from games table
+                cursor.execute('''
+                    SELECT g.*, GROUP_CONCAT(t.tag) as tags
+                    FROM games g
+                    JOIN _export_ids e ON g.app_id = e.app_id
+                    LEFT JOIN tags t ON g.app_id = t.app_id
+                    GROUP BY g.app_id
+                ''')
+
+                # Get column names
+                columns = [description[0] for description in cursor.description]
+
+                # Stream rows straight off the cursor so the full result
+                # set is never materialised in memory
+                if format_type == 'csv':
+                    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                        writer = csv.writer(f)
+                        writer.writerow(columns)  # Write headers
+                        writer.writerows(cursor)
+                elif format_type == 'json':
+                    with open(output_path, 'w', encoding='utf-8') as f:
+                        f.write('[\n')
+                        first = True
+                        for row in cursor:
+                            if not first:
+                                f.write(',\n')
+                            first = False
+                            f.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+                        f.write('\n]')
+                elif format_type == 'excel':
+                    # constant_memory flushes each row to disk as written
+                    # instead of holding the workbook in RAM
+                    workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+                    worksheet = workbook.add_worksheet()
+                    worksheet.write_row(0, 0, columns)
+                    for row_no, row in enumerate(cursor, 1):
+                        worksheet.write_row(row_no, 0, row)
+                    workbook.close()
+            finally:
+                cursor.execute('DROP TABLE IF EXISTS _export_ids')
             
             self.status_var.set(f"Results exported to {output_path}")
             messagebox.showinfo("Success", f"Results exported to {output_path} with all fields!")
@@ -389,11 +624,6 @@ class SteamDBSearch:
             logging.error(f"Export error: {e}")
             messagebox.showerror("Error", f"Export error: {str(e)}")
     
-    def __del__(self):
-        """Cleanup database connection"""
-        if self.db_conn:
-            self.db_conn.close()
-
 def main():
     root = tk.Tk()
     app = SteamDBSearch(root)
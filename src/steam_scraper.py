@@ -1,19 +1,43 @@
 import logging
 import json
 import csv
+import queue
+import re
 import time
 import os
-from datetime import datetime
+import threading
+from datetime import datetime, timedelta
 import pandas as pd
+import xlsxwriter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml.etree import XPath
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sqlite3
 from pathlib import Path
+from contextlib import contextmanager
+
+# orjson's C serialiser is markedly faster for big exports; fall back
+# quietly to stdlib json when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_dumps(obj):
+    """Serialise one export row as compact JSON"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+from urllib.parse import urlparse, parse_qsl
 
 # Configure logging
 logging.basicConfig(
@@ -25,20 +49,299 @@ logging.basicConfig(
     ]
 )
 
+# Hot write-path SQL as module constants: the identical text is what lets
+# SQLite's prepared-statement cache reuse the compiled plan across flushes.
+# The guarded UPSERT (rather than INSERT OR REPLACE, which deletes and
+# reinserts) leaves unchanged rows untouched on re-scrapes, so a re-run
+# over a mostly-unchanged catalogue dirties almost no pages.
+_GAME_DATA_COLUMNS = (
+    'name', 'developer', 'publisher', 'release_date',
+    'full_description', 'short_description', 'price',
+    'system_requirements', 'supported_languages',
+    'user_rating', 'review_count', 'steam_url', 'header_image',
+    'screenshot1', 'screenshot2', 'screenshot3', 'screenshot4', 'screenshot5',
+    'release_dt_start', 'release_dt_end',
+)
+SQL_UPSERT_GAME = '''
+    INSERT INTO games (
+        app_id, {cols}, last_updated
+    ) VALUES ({marks})
+    ON CONFLICT(app_id) DO UPDATE SET
+        {assignments},
+        last_updated = excluded.last_updated
+    WHERE ({games_tuple}) IS NOT ({excluded_tuple})
+'''.format(
+    cols=', '.join(_GAME_DATA_COLUMNS),
+    marks=', '.join('?' * (len(_GAME_DATA_COLUMNS) + 2)),
+    assignments=', '.join(f'{c} = excluded.{c}' for c in _GAME_DATA_COLUMNS),
+    games_tuple=', '.join(f'games.{c}' for c in _GAME_DATA_COLUMNS),
+    excluded_tuple=', '.join(f'excluded.{c}' for c in _GAME_DATA_COLUMNS),
+)
+# OR IGNORE: once a UI migration has added the unique (app_id, tag)
+# index, a duplicate tag within one scraped page would otherwise raise
+# IntegrityError and roll back the whole batch
+SQL_INSERT_TAG = "INSERT OR IGNORE INTO tags (app_id, tag) VALUES (?, ?)"
+
+# Normalised release-date bounds (unix seconds; month-only dates span the
+# whole month) are stored alongside the raw string so the web UI can
+# filter in SQL without re-parsing every row
+_DATE_BOUNDS_RE = re.compile(
+    r'^(?:(?P<day1>\d{1,2})\s+(?P<mon1>[A-Za-z]{3}),\s+(?P<year1>\d{4})'
+    r'|(?P<mon2>[A-Za-z]+)\s+(?:(?P<day2>\d{1,2}),\s+)?(?P<year2>\d{4}))$')
+_MONTH_NUM = {name: i for i, names in enumerate((
+    ('Jan', 'January'), ('Feb', 'February'), ('Mar', 'March'),
+    ('Apr', 'April'), ('May', 'May'), ('Jun', 'June'),
+    ('Jul', 'July'), ('Aug', 'August'), ('Sep', 'September'),
+    ('Oct', 'October'), ('Nov', 'November'), ('Dec', 'December')), 1)
+    for name in names}
+
+def release_date_bounds(date_str):
+    """(start, end) unix seconds for a Steam date string, or (None, None)"""
+    if not date_str:
+        return None, None
+    m = _DATE_BOUNDS_RE.match(date_str.strip())
+    if not m:
+        return None, None
+    try:
+        if m.group('mon1'):
+            dt = datetime(int(m.group('year1')), _MONTH_NUM[m.group('mon1')],
+                          int(m.group('day1')))
+            ts = int(dt.timestamp())
+            return ts, ts
+        month = _MONTH_NUM[m.group('mon2')]
+        year = int(m.group('year2'))
+        if m.group('day2'):
+            dt = datetime(year, month, int(m.group('day2')))
+            ts = int(dt.timestamp())
+            return ts, ts
+        month_start = datetime(year, month, 1)
+        next_month = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+        return int(month_start.timestamp()), int((next_month - timedelta(days=1)).timestamp())
+    except (KeyError, ValueError):
+        return None, None
+
+# App ids live in /app/<id>/ URLs; store pages for packages use /sub/ or
+# /bundle/. The CDN prefix is shared by screenshots and header images.
+APP_ID_RE = re.compile(r"/(?:app|sub|bundle)/(\d+)")
+PRICE_RE = re.compile(r"([\d,]+(?:\.\d+)?)")
+DIGITS_RE = re.compile(r"\d+")
+CDN_PREFIX = "https://shared.cloudflare.steamstatic.com/store_item_assets/steam/apps/"
+
+def _extract_app_id(url):
+    """Pull the numeric app id out of a store URL"""
+    m = APP_ID_RE.search(url)
+    return m.group(1) if m else url.split('/')[4]
+
+def _class_xpath(name):
+    """XPath predicate matching a CSS class token (like .name in CSS)"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_LOWER = "translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+# Compiled once at import; each detail page is then parsed in a single
+# lxml tree walk instead of dozens of independent CSS-selector probes
+_XP_NAME = XPath(f"//*[{_class_xpath('apphub_AppName')}]")
+_XP_DEVELOPER = XPath("//*[@id='developers_list']")
+_XP_PUBLISHER_LINK = XPath(
+    f"//div[{_class_xpath('dev_row')}]"
+    f"[.//*[{_class_xpath('subtitle')} and contains({_LOWER}, 'publisher')]]//a"
+    f" | //a[contains(@href, '/publisher/')]")
+_XP_PUBLISHER_ROW = XPath(
+    f"//div[{_class_xpath('dev_row')}]"
+    f"[.//*[{_class_xpath('subtitle')} and contains({_LOWER}, 'publisher')]]")
+_XP_DETAILS_BLOCKS = XPath(f"//div[{_class_xpath('details_block')}]")
+_XP_RELEASE_DATE = XPath(
+    f"//*[{_class_xpath('release_date')}]//*[{_class_xpath('date')}]")
+_XP_FULL_DESC = XPath("//*[@id='game_area_description']")
+_XP_SHORT_DESC = XPath(f"//*[{_class_xpath('game_description_snippet')}]")
+_XP_SCREENSHOT_SRC = XPath(
+    "//img[contains(@src, $pattern) and not(contains(@src, 'blank.gif'))]/@src")
+_XP_SCREENSHOT_HOLDERS = XPath(f"//*[{_class_xpath('screenshot_holder')}]")
+_XP_HEADER_FULL = XPath(f"//img[{_class_xpath('game_header_image_full')}]/@src")
+_XP_HEADER_ALT = XPath(f"//img[{_class_xpath('game_header_image')}]/@src")
+_XP_PRICE = XPath(f"//*[{_class_xpath('game_purchase_price')}]")
+_XP_SYSREQ = XPath(f"//*[{_class_xpath('sysreq_contents')}]")
+_XP_TAG_TEXTS = XPath(f"//*[{_class_xpath('app_tag')}]/text()")
+_XP_LANGUAGES = XPath("//*[@id='language_dropdown']")
+_XP_REVIEW_SUMMARY = XPath(f"//*[{_class_xpath('game_review_summary')}]")
+_XP_REVIEW_COUNT = XPath(f"//*[{_class_xpath('review_count')}]")
+
+class RateLimiter:
+    """Thread-safe token bucket capping aggregate request rate.
+
+    Politeness is decoupled from concurrency: workers can fan out while
+    the bucket limits how many requests per time_period actually leave.
+    """
+
+    def __init__(self, max_rate=5, time_period=1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.max_rate),
+                    self._tokens + (now - self._last_refill) * self.max_rate / self.time_period)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.time_period / self.max_rate
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
 class SteamScraper:
+    # Steam's search page is backed by this AJAX endpoint; paging it
+    # directly avoids driving a browser through infinite scroll
+    SEARCH_RESULTS_URL = "https://store.steampowered.com/search/results/"
+    SEARCH_PAGE_SIZE = 100
+
+    # Pooled read-only connections (the writer stays singular)
+    READER_POOL_SIZE = 4
+
     def __init__(self, base_url, db_name='steam_games.db'):
         self.base_url = base_url
         self.db_name = db_name
         self.driver = None
         self.db_conn = None
+        # Serialises writes when scrape_game_details runs on worker threads
+        self._db_lock = threading.Lock()
+        # Flush after this many queued games; callers doing bulk scrapes
+        # raise it so one transaction (one fsync) covers a whole batch
+        self.commit_every = 1
+        self._pending_games = []
+        # Existing-id set, loaded once per run and kept current on insert
+        self._existing_app_ids = None
+        # Concurrent scrapes hand finished games to one writer thread via
+        # this queue (single-writer pattern) instead of contending for the
+        # database lock
+        self._write_q = queue.Queue(maxsize=1000)
+        self._writer_thread = None
+        self._writer_stop = threading.Event()
+        # Read-only connections for exports/queries; WAL lets them run in
+        # parallel with the single writer
+        self._reader_pool = queue.LifoQueue(maxsize=self.READER_POOL_SIZE)
+        self._owns_connection = True
+        # Pooled HTTP session: keep-alive skips the TCP+TLS handshake that
+        # otherwise dominates each detail-page fetch
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                              max_retries=Retry(total=3, backoff_factor=1.0,
+                                                status_forcelist=[429, 500, 502, 503, 504],
+                                                respect_retry_after_header=True))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Compressed responses halve HTML payloads; advertise brotli only
+        # when the decoder is actually available
+        accept_encoding = 'gzip, deflate'
+        try:
+            import brotli  # noqa: F401
+            accept_encoding += ', br'
+        except ImportError:
+            pass
+        self.session.headers.update({
+            'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                           'steam-all-game-scraper'),
+            'Accept-Encoding': accept_encoding,
+        })
+        # One token bucket per host so the store and CDN hosts get
+        # independent budgets; rate is configurable from the GUIs
+        self.requests_per_second = 5
+        self._rate_limiters = {}
+        self._rate_lock = threading.Lock()
         self.setup_database()
+
+    def _throttled_get(self, url, **kwargs):
+        """session.get gated by the per-host token bucket"""
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            limiter = self._rate_limiters.get(host)
+            if limiter is None:
+                limiter = RateLimiter(max_rate=self.requests_per_second)
+                self._rate_limiters[host] = limiter
+        with limiter:
+            return self.session.get(url, **kwargs)
+
+    def set_connection(self, conn, owns_connection=False):
+        """Swap in an externally managed (e.g. pooled) database connection"""
+        with self._db_lock:
+            self._flush_locked()
+            if self.db_conn is not None and self._owns_connection:
+                self.db_conn.close()
+            self.db_conn = conn
+            self._owns_connection = owns_connection
+            self._existing_app_ids = None
+
+    def flush(self):
+        """Write any queued games still pending"""
+        with self._db_lock:
+            self._flush_locked()
+
+    @contextmanager
+    def writer(self):
+        """Exclusive access to the (single) write connection"""
+        with self._db_lock:
+            yield self.db_conn
+
+    @contextmanager
+    def reader(self):
+        """Borrow a pooled read-only connection.
+
+        Readers open the database with mode=ro/query_only and, thanks to
+        WAL, run fully in parallel with the writer.
+        """
+        try:
+            conn = self._reader_pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(f'file:{self.db_name}?mode=ro', uri=True,
+                                   check_same_thread=False)
+            conn.execute('PRAGMA query_only=1')
+        try:
+            yield conn
+        finally:
+            try:
+                self._reader_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
         
+    def _open_connection(self):
+        """Open a connection with the pragmas every scraper connection needs.
+
+        WAL plus synchronous=NORMAL turns the per-commit double fsync into
+        an occasional WAL sync, which dominates insert latency otherwise.
+        isolation_level=None means transactions are driven explicitly with
+        BEGIN/COMMIT in the save path.
+        """
+        conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                               isolation_level=None, cached_statements=256)
+        cursor = conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-65536')
+        cursor.execute('PRAGMA busy_timeout=5000')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.close()
+        return conn
+
     def setup_database(self):
         """Initialize SQLite database and create necessary tables"""
         try:
-            self.db_conn = sqlite3.connect(self.db_name)
+            self.db_conn = self._open_connection()
             cursor = self.db_conn.cursor()
-            
+
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS games (
                     app_id INTEGER PRIMARY KEY,
@@ -60,9 +363,33 @@ class SteamScraper:
                     screenshot3 TEXT,
                     screenshot4 TEXT,
                     screenshot5 TEXT,
+                    release_dt_start INTEGER,
+                    release_dt_end INTEGER,
                     last_updated TIMESTAMP
                 )
             ''')
+
+            # Databases created before the normalised date columns existed
+            columns = {row[1] for row in cursor.execute('PRAGMA table_info(games)')}
+            if 'release_dt_start' not in columns:
+                cursor.execute('ALTER TABLE games ADD COLUMN release_dt_start INTEGER')
+                cursor.execute('ALTER TABLE games ADD COLUMN release_dt_end INTEGER')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_release ON games(release_dt_start, release_dt_end)')
+
+            # Backfill rows scraped before the columns existed
+            cursor.execute('''
+                SELECT app_id, release_date FROM games
+                WHERE release_dt_start IS NULL AND release_date IS NOT NULL
+            ''')
+            updates = []
+            for app_id, release_date in cursor.fetchall():
+                start_ts, end_ts = release_date_bounds(release_date)
+                if start_ts is not None:
+                    updates.append((start_ts, end_ts, app_id))
+            if updates:
+                cursor.executemany(
+                    'UPDATE games SET release_dt_start = ?, release_dt_end = ? WHERE app_id = ?',
+                    updates)
             
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS tags (
@@ -72,7 +399,10 @@ class SteamScraper:
                     FOREIGN KEY (app_id) REFERENCES games (app_id)
                 )
             ''')
-            
+
+            # Without this, every per-game tag delete is a full table scan
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_tags_app_id ON tags(app_id)')
+
             self.db_conn.commit()
         except sqlite3.Error as e:
             logging.error(f"Database error: {e}")
@@ -88,21 +418,147 @@ class SteamScraper:
         self.driver = webdriver.Chrome(options=options)
         
     def get_existing_app_ids(self):
-        """Get list of app IDs already in database"""
+        """Get the set of app IDs already in database, cached per run.
+
+        The set is kept current as batches flush, so repeat calls avoid
+        re-reading every row.
+        """
+        if self._existing_app_ids is not None:
+            return self._existing_app_ids
         try:
             cursor = self.db_conn.cursor()
+            cursor.arraysize = 1000
             cursor.execute("SELECT app_id FROM games")
-            return {str(row[0]) for row in cursor.fetchall()}
+            # ints, not strings: roughly halves the set's footprint on a
+            # million-game database
+            self._existing_app_ids = {row[0] for row in cursor}
+            return self._existing_app_ids
         except sqlite3.Error as e:
             logging.error(f"Database error getting existing app IDs: {e}")
             return set()
 
+    def _filter_new_links(self, pairs):
+        """Return hrefs for (app_id, href) pairs not already in games.
+
+        The membership test joins a temp table against the games primary
+        key inside SQLite, so the existing-id set never has to be
+        materialised as Python strings.
+        """
+        if not pairs:
+            return []
+        cursor = self.db_conn.cursor()
+        cursor.execute('CREATE TEMP TABLE IF NOT EXISTS _candidates(app_id TEXT PRIMARY KEY, href TEXT)')
+        cursor.execute('DELETE FROM _candidates')
+        cursor.executemany('INSERT OR IGNORE INTO _candidates VALUES (?, ?)', pairs)
+        cursor.execute('''
+            SELECT href FROM _candidates c
+            LEFT JOIN games g ON g.app_id = c.app_id
+            WHERE g.app_id IS NULL
+        ''')
+        return [row[0] for row in cursor.fetchall()]
+
+    def _fetch_search_page(self, params, start):
+        """Fetch one search-results page, returning its results_html"""
+        page_params = dict(params)
+        page_params['start'] = start
+        try:
+            response = self._throttled_get(self.SEARCH_RESULTS_URL,
+                                           params=page_params, timeout=10)
+            response.raise_for_status()
+            return response.json().get('results_html', '')
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logging.warning(f"Search page start={start} failed: {e}")
+            return ''
+
+    @staticmethod
+    def _links_from_html(results_html):
+        """(app_id, href) pairs out of one results_html fragment"""
+        if not results_html.strip():
+            return []
+        soup = BeautifulSoup(results_html, 'lxml')
+        return [(_extract_app_id(href), href)
+                for href in (elem.get('href') for elem in soup.select('a.search_result_row'))
+                if href]
+
+    def collect_games_via_api(self):
+        """Collect game links by paging Steam's search JSON endpoint.
+
+        The first page reports total_count, after which the remaining
+        pages are independent and fetched concurrently (still behind the
+        per-host rate limiter).
+        """
+        params = dict(parse_qsl(urlparse(self.base_url).query))
+        params.update({'count': self.SEARCH_PAGE_SIZE, 'infinite': 1, 'json': 1})
+
+        game_links = set()
+        cursor = self.db_conn.cursor()
+        existing_count = cursor.execute('SELECT COUNT(*) FROM games').fetchone()[0]
+        logging.info(f"Found {existing_count} existing games in database")
+
+        params['start'] = 0
+        response = self._throttled_get(self.SEARCH_RESULTS_URL, params=params, timeout=10)
+        response.raise_for_status()
+        data = response.json()
+        total_count = data.get('total_count')
+        logging.info(f"Search reports {total_count} total results")
+
+        first_html = data.get('results_html', '')
+        game_links.update(self._filter_new_links(self._links_from_html(first_html)))
+
+        if total_count and total_count > self.SEARCH_PAGE_SIZE:
+            # Remaining pages are known up front; fan the fetches out and
+            # fold results back on this thread (the db connection side)
+            starts = range(self.SEARCH_PAGE_SIZE, total_count, self.SEARCH_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for results_html in executor.map(
+                        lambda page_start: self._fetch_search_page(params, page_start),
+                        starts):
+                    game_links.update(self._filter_new_links(
+                        self._links_from_html(results_html)))
+
+        elif total_count is None and first_html.strip():
+            # Unknown total: page sequentially until an empty or repeated
+            # page (a server ignoring start would otherwise loop forever)
+            previous_html = first_html
+            start = self.SEARCH_PAGE_SIZE
+            while True:
+                results_html = self._fetch_search_page(params, start)
+                if not results_html.strip():
+                    break
+                if results_html == previous_html:
+                    logging.warning("Search page did not advance; stopping collection")
+                    break
+                previous_html = results_html
+                game_links.update(self._filter_new_links(
+                    self._links_from_html(results_html)))
+                start += self.SEARCH_PAGE_SIZE
+
+        logging.info(f"Final collection: {len(game_links)} new games to scrape")
+        logging.info(f"Total games (including existing): {len(game_links) + existing_count}")
+        return list(game_links)
+
     def scroll_and_collect_games(self):
+        """Collect all game links for the configured search"""
+        try:
+            return self.collect_games_via_api()
+        except Exception as e:
+            logging.warning(f"Search API collection failed ({e}); falling back to browser scrolling")
+            return self._collect_games_selenium()
+
+    def _collect_games_selenium(self):
         """Scroll through the Steam store and collect all game links"""
         try:
+            # The existing-ids scan only needs the database, so run it
+            # while Chrome starts up and loads the first page
+            prefetch = ThreadPoolExecutor(max_workers=1)
+            existing_future = prefetch.submit(self.get_existing_app_ids)
+            prefetch.shutdown(wait=False)
+
+            if self.driver is None:
+                self.initialize_driver()
             self.driver.get(self.base_url)
             game_links = set()
-            existing_apps = self.get_existing_app_ids()
+            existing_apps = existing_future.result()
             last_count = 0
             no_new_games_count = 0
             max_attempts = 5  # Maximum number of attempts with no new games
@@ -125,8 +581,12 @@ class SteamScraper:
                 for elem in elements:
                     href = elem.get_attribute('href')
                     if href:
-                        app_id = href.split('/')[4]
-                        if app_id not in existing_apps:  # Only add if not in database
+                        app_id = _extract_app_id(href)
+                        try:
+                            known = int(app_id) in existing_apps
+                        except ValueError:
+                            known = False
+                        if not known:  # Only add if not in database
                             game_links.add(href)
                 
                 current_count = len(game_links)
@@ -163,302 +623,282 @@ class SteamScraper:
             return []
 
     def scrape_game_details(self, url):
-        """Scrape detailed information for a single game"""
-        max_retries = 3
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                response = requests.get(url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                app_id = url.split('/')[4]
-                
-                # Initialize with default values
-                game_data = {
-                    'app_id': app_id,
-                    'steam_url': url,
-                    'name': 'Unknown',
-                    'developer': 'Unknown',
-                    'publisher': 'Unknown',
-                    'release_date': 'Unknown',
-                    'full_description': '',
-                    'short_description': '',
-                    'price': 0.0,
-                    'system_requirements': '',
-                    'tags': [],
-                    'supported_languages': '',
-                    'user_rating': None,
-                    'review_count': 0,
-                    'header_image': '',
-                    'screenshot1': '',
-                    'screenshot2': '',
-                    'screenshot3': '',
-                    'screenshot4': '',
-                    'screenshot5': ''
-                }
-                
-                # Safely extract elements
-                name_elem = soup.select_one('.apphub_AppName')
-                if name_elem:
-                    game_data['name'] = name_elem.text.strip()
-                
-                dev_elem = soup.select_one('#developers_list')
-                if dev_elem:
-                    game_data['developer'] = dev_elem.text.strip()
-                
-                # Extract publisher - try multiple methods to find the correct publisher info
-                publisher = 'Unknown'
-                
-                # Method 1: Look for publisher in the details block
-                pub_elem = soup.select_one('.dev_row')
-                if pub_elem:
-                    # Check if this row contains "Publisher:" text
-                    subtitle = pub_elem.select_one('.subtitle')
-                    if subtitle and 'publisher' in subtitle.text.lower():
-                        # Get the next sibling which contains the publisher name
-                        publisher_link = pub_elem.select_one('a')
-                        if publisher_link:
-                            publisher = publisher_link.text.strip()
-                        else:
-                            # Fallback: get text after the subtitle
-                            text_content = pub_elem.get_text()
-                            if ':' in text_content:
-                                publisher = text_content.split(':', 1)[1].strip()
-                
-                # Method 2: Look for publisher in game details section
-                if publisher == 'Unknown':
-                    # Try to find publisher in the game details section
-                    details_block = soup.select('.details_block')
-                    for block in details_block:
-                        block_text = block.get_text()
-                        if 'Publisher:' in block_text:
-                            lines = block_text.split('\n')
-                            for i, line in enumerate(lines):
-                                if 'Publisher:' in line and i + 1 < len(lines):
-                                    publisher = lines[i + 1].strip()
-                                    break
+        """Scrape detailed information for a single game.
+
+        Retries (with exponential backoff, honouring Retry-After on 429s)
+        happen inside the session's urllib3 Retry configuration, so a
+        failing request never blocks its worker with a blind sleep.
+        """
+        try:
+            response = self._throttled_get(url, timeout=10)
+            response.raise_for_status()
+            game_data = self._parse_game_page(response.content, url,
+                                              _extract_app_id(url))
+
+            self._save_to_database(game_data)
+            return game_data
+
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Failed to scrape {url}: {e}")
+            return None
+        except Exception as e:
+            logging.error(f"Error scraping {url}: {e}")
+            return None
+
+    def _parse_game_page(self, content, url, app_id):
+        """Extract all game fields from a detail page in one lxml pass"""
+        tree = lxml.html.fromstring(content)
+
+        # Initialize with default values
+        game_data = {
+            'app_id': app_id,
+            'steam_url': url,
+            'name': 'Unknown',
+            'developer': 'Unknown',
+            'publisher': 'Unknown',
+            'release_date': 'Unknown',
+            'full_description': '',
+            'short_description': '',
+            'price': 0.0,
+            'system_requirements': '',
+            'tags': [],
+            'supported_languages': '',
+            'user_rating': None,
+            'review_count': 0,
+            'header_image': '',
+            'screenshot1': '',
+            'screenshot2': '',
+            'screenshot3': '',
+            'screenshot4': '',
+            'screenshot5': ''
+        }
+
+        def first_text(xpath):
+            elems = xpath(tree)
+            return elems[0].text_content().strip() if elems else ''
+
+        game_data['name'] = first_text(_XP_NAME) or 'Unknown'
+        game_data['developer'] = first_text(_XP_DEVELOPER) or 'Unknown'
+        game_data['release_date'] = first_text(_XP_RELEASE_DATE) or 'Unknown'
+        game_data['full_description'] = first_text(_XP_FULL_DESC)
+        game_data['short_description'] = first_text(_XP_SHORT_DESC)
+
+        # Publisher: the union XPath covers the dev_row subtitle and the
+        # /publisher/ link variants; text-only rows and the details block
+        # remain as fallbacks, then the developer (common for indie games)
+        publisher = first_text(_XP_PUBLISHER_LINK)
+        if not publisher:
+            rows = _XP_PUBLISHER_ROW(tree)
+            if rows:
+                text_content = rows[0].text_content()
+                if ':' in text_content:
+                    publisher = text_content.split(':', 1)[1].strip()
+        if not publisher:
+            for block in _XP_DETAILS_BLOCKS(tree):
+                block_text = block.text_content()
+                if 'Publisher:' in block_text:
+                    lines = block_text.split('\n')
+                    for i, line in enumerate(lines):
+                        if 'Publisher:' in line and i + 1 < len(lines):
+                            publisher = lines[i + 1].strip()
                             break
-                
-                # Method 3: Look for specific publisher elements
-                if publisher == 'Unknown':
-                    # Try alternative selectors
-                    pub_link = soup.select_one('a[href*="/publisher/"]')
-                    if pub_link:
-                        publisher = pub_link.text.strip()
-                
-                # Method 4: Look in glance_ctn section
-                if publisher == 'Unknown':
-                    glance_section = soup.select_one('.glance_ctn')
-                    if glance_section:
-                        dev_rows = glance_section.select('.dev_row')
-                        for row in dev_rows:
-                            subtitle = row.select_one('.subtitle')
-                            if subtitle and 'publisher' in subtitle.text.lower():
-                                pub_link = row.select_one('a')
-                                if pub_link:
-                                    publisher = pub_link.text.strip()
-                                    break
-                
-                # If still not found, fallback to developer (which is common for indie games)
-                if publisher == 'Unknown' and game_data['developer'] != 'Unknown':
-                    publisher = game_data['developer']
-                
-                game_data['publisher'] = publisher
-                
-                date_elem = soup.select_one('.release_date .date')
-                if date_elem:
-                    game_data['release_date'] = date_elem.text.strip()
-                
-                desc_elem = soup.select_one('#game_area_description')
-                if desc_elem:
-                    game_data['full_description'] = desc_elem.text.strip()
-                
-                short_desc_elem = soup.select_one('.game_description_snippet')
-                if short_desc_elem:
-                    game_data['short_description'] = short_desc_elem.text.strip()
-                
-                # Collect different types of images
-                
-                # 1. Get screenshots using multiple methods
-                screenshots = []
-                
-                # Method 1: Try to get screenshots from the page's HTML directly
-                # Look for URLs that match the pattern in the entire page source
-                screenshot_pattern = f"https://shared.cloudflare.steamstatic.com/store_item_assets/steam/apps/{app_id}/ss_"
-                for img in soup.find_all('img'):
-                    if 'src' in img.attrs:
-                        src = img['src']
-                        if screenshot_pattern in src and 'blank.gif' not in src:
-                            # Convert to full-size URL if needed
-                            if '.116x65' in src:
-                                src = src.replace('.116x65', '')
-                            if '.600x338' in src:
-                                src = src.replace('.600x338', '')
-                            screenshots.append(src)
-                
-                # Method 2: Try to get screenshots from the screenshot_holder divs
-                if not screenshots:
-                    screenshot_divs = soup.select('.screenshot_holder')
-                    for div in screenshot_divs:
-                        # Look for img tags within the screenshot_holder
-                        img_tag = div.select_one('img')
-                        if img_tag and 'src' in img_tag.attrs:
-                            img_url = img_tag['src']
-                            # Convert thumbnail URL to full-size URL if needed
-                            if '.116x65' in img_url:
-                                img_url = img_url.replace('.116x65', '')
-                            if '.600x338' in img_url:
-                                img_url = img_url.replace('.600x338', '')
-                            if img_url and 'blank.gif' not in img_url:
-                                screenshots.append(img_url)
-                
-                # Method 3: Try to get screenshots from the links
-                if not screenshots:
-                    screenshot_links = soup.select('.screenshot_holder a')
-                    for link in screenshot_links:
-                        if 'href' in link.attrs:
-                            img_url = link['href']
-                            if img_url and 'blank.gif' not in img_url:
-                                screenshots.append(img_url)
-                
-                # Log screenshot information
-                if screenshots:
-                    logging.info(f"Found {len(screenshots)} screenshots for {game_data['name']} (App ID: {app_id})")
-                    # Store up to 5 screenshots in individual fields
-                    for i, url in enumerate(screenshots[:5], 1):
-                        game_data[f'screenshot{i}'] = url
-                else:
-                    logging.warning(f"No screenshots found for {game_data['name']} (App ID: {app_id})")
-                
-                # 2. Get header image
-                header_image = ''
-                
-                # Try to find the header image using the specific class
-                header_img_elem = soup.select_one('.game_header_image_full')
-                if header_img_elem and 'src' in header_img_elem.attrs:
-                    header_image = header_img_elem['src']
-                
-                # If not found, try the alternative class
-                if not header_image:
-                    header_img_elem = soup.select_one('.game_header_image')
-                    if header_img_elem and 'src' in header_img_elem.attrs:
-                        header_image = header_img_elem['src']
-                
-                # If still not found, try to construct it from the app_id
-                if not header_image:
-                    header_image = f"https://shared.cloudflare.steamstatic.com/store_item_assets/steam/apps/{app_id}/header.jpg"
-                    logging.info(f"Constructed header image URL for {game_data['name']} (App ID: {app_id})")
-                
-                if header_image and 'blank.gif' not in header_image:
-                    game_data['header_image'] = header_image
-                    logging.info(f"Found header image for {game_data['name']} (App ID: {app_id})")
-                else:
-                    logging.warning(f"No header image found for {game_data['name']} (App ID: {app_id})")
-                game_data['price'] = self._extract_price(soup)
-                game_data['system_requirements'] = self._extract_system_requirements(soup)
-                game_data['tags'] = [tag.text.strip() for tag in soup.select('.app_tag')]
-                
-                lang_elem = soup.select_one('#language_dropdown')
-                if lang_elem:
-                    game_data['supported_languages'] = lang_elem.text.strip()
-                
-                game_data['user_rating'] = self._extract_user_rating(soup)
-                game_data['review_count'] = self._extract_review_count(soup)
-                
-                self._save_to_database(game_data)
-                return game_data
-                
-            except requests.exceptions.RequestException as e:
-                retry_count += 1
-                logging.warning(f"Attempt {retry_count} failed for {url}: {e}")
-                time.sleep(5)  # Wait before retrying
-                
-            except Exception as e:
-                logging.error(f"Error scraping {url}: {e}")
-                return None
-                
-        logging.error(f"Failed to scrape {url} after {max_retries} attempts")
-        return None
+                    break
+        if not publisher and game_data['developer'] != 'Unknown':
+            publisher = game_data['developer']
+        game_data['publisher'] = publisher or 'Unknown'
 
-    def _extract_price(self, soup):
-        """Extract price information from the page"""
-        price_elem = soup.select_one('.game_purchase_price')
-        if price_elem and not price_elem.text.strip().lower() == 'free':
-            return float(price_elem.text.strip().replace('$', '').replace(',', ''))
-        return 0.0
+        # Screenshots: one attribute query against the CDN pattern, with
+        # the screenshot_holder img/a variants as fallbacks
+        screenshot_pattern = f"{CDN_PREFIX}{app_id}/ss_"
+        # Only five screenshots are stored, so only normalise that many
+        screenshots = [src.replace('.116x65', '').replace('.600x338', '')
+                       for src in _XP_SCREENSHOT_SRC(tree, pattern=screenshot_pattern)[:5]]
+
+        if not screenshots:
+            for holder in _XP_SCREENSHOT_HOLDERS(tree):
+                img = holder.find('.//img')
+                if img is not None and img.get('src'):
+                    img_url = img.get('src').replace('.116x65', '').replace('.600x338', '')
+                    if img_url and 'blank.gif' not in img_url:
+                        screenshots.append(img_url)
+
+        if not screenshots:
+            for holder in _XP_SCREENSHOT_HOLDERS(tree):
+                link = holder.find('.//a')
+                if link is not None and link.get('href') and 'blank.gif' not in link.get('href'):
+                    screenshots.append(link.get('href'))
+
+        if screenshots:
+            logging.info(f"Found {len(screenshots)} screenshots for {game_data['name']} (App ID: {app_id})")
+            # Store up to 5 screenshots in individual fields
+            for i, screenshot_url in enumerate(screenshots[:5], 1):
+                game_data[f'screenshot{i}'] = screenshot_url
+        else:
+            logging.warning(f"No screenshots found for {game_data['name']} (App ID: {app_id})")
 
-    def _extract_system_requirements(self, soup):
-        """Extract system requirements from the page"""
-        sys_req = soup.select_one('.sysreq_contents')
-        return sys_req.text.strip() if sys_req else ''
+        # Header image, falling back to the CDN URL built from the app_id
+        headers = _XP_HEADER_FULL(tree) or _XP_HEADER_ALT(tree)
+        header_image = headers[0] if headers else ''
+        if not header_image:
+            header_image = f"{CDN_PREFIX}{app_id}/header.jpg"
+            logging.info(f"Constructed header image URL for {game_data['name']} (App ID: {app_id})")
+        if header_image and 'blank.gif' not in header_image:
+            game_data['header_image'] = header_image
 
-    def _extract_user_rating(self, soup):
-        """Extract user rating percentage"""
-        rating_elem = soup.select_one('.game_review_summary')
-        return float(rating_elem.text.strip().replace('%', '')) if rating_elem else None
+        game_data['price'] = self._extract_price(tree)
+        game_data['system_requirements'] = first_text(_XP_SYSREQ)
+        game_data['tags'] = [text for text in
+                             (raw.strip() for raw in _XP_TAG_TEXTS(tree)) if text]
+        game_data['supported_languages'] = first_text(_XP_LANGUAGES)
+        game_data['user_rating'] = self._extract_user_rating(tree)
+        game_data['review_count'] = self._extract_review_count(tree)
+
+        return game_data
+
+    def _extract_price(self, tree):
+        """Extract price information from the page.
+
+        The regex tolerates any currency symbol/position; free and
+        unpriced games come back as 0.0.
+        """
+        price_elems = _XP_PRICE(tree)
+        if price_elems:
+            m = PRICE_RE.search(price_elems[0].text_content())
+            if m:
+                return float(m.group(1).replace(',', ''))
+        return 0.0
 
-    def _extract_review_count(self, soup):
+    def _extract_user_rating(self, tree):
+        """Extract user rating percentage (None for textual summaries)"""
+        rating_elems = _XP_REVIEW_SUMMARY(tree)
+        if rating_elems:
+            m = DIGITS_RE.search(rating_elems[0].text_content())
+            if m:
+                return float(m.group(0))
+        return None
+
+    def _extract_review_count(self, tree):
         """Extract number of user reviews"""
-        review_elem = soup.select_one('.review_count')
-        if review_elem:
-            count_text = review_elem.text.strip().replace(',', '')
-            return int(''.join(filter(str.isdigit, count_text)))
+        review_elems = _XP_REVIEW_COUNT(tree)
+        if review_elems:
+            digits = DIGITS_RE.findall(review_elems[0].text_content().replace(',', ''))
+            if digits:
+                return int(''.join(digits))
         return 0
 
+    def start_writer(self):
+        """Start the dedicated writer thread draining queued game data"""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        self._writer_stop.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop,
+                                               daemon=True, name='db-writer')
+        self._writer_thread.start()
+
+    def stop_writer(self):
+        """Drain the queue and stop the writer thread"""
+        if self._writer_thread:
+            self._writer_stop.set()
+            self._writer_thread.join()
+            self._writer_thread = None
+
+    def _writer_loop(self):
+        """Drain the write queue in batches, one transaction per batch"""
+        while not (self._writer_stop.is_set() and self._write_q.empty()):
+            try:
+                game_data = self._write_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            batch = [game_data]
+            while len(batch) < self.commit_every:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            with self._db_lock:
+                self._pending_games.extend(batch)
+                self._flush_locked()
+
     def _save_to_database(self, game_data):
-        """Save game data to SQLite database"""
+        """Queue game data, flushing a whole batch per transaction.
+
+        With the writer thread running, workers only enqueue; otherwise
+        the calling thread batches under the database lock itself.
+        """
+        if self._writer_thread and self._writer_thread.is_alive():
+            self._write_q.put(game_data)
+            return
+        with self._db_lock:
+            self._log_data_changes(game_data)
+            self._pending_games.append(game_data)
+            if len(self._pending_games) >= self.commit_every:
+                self._flush_locked()
+
+    def _log_data_changes(self, game_data):
+        """Log when a re-scraped game's stored data differs.
+
+        Purely diagnostic: the two SELECTs double the statement count on
+        the write path, so they only run when DEBUG logging is enabled.
+        """
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
         try:
             cursor = self.db_conn.cursor()
-            
+
             # Check if game exists and if data has changed
             cursor.execute("SELECT last_updated FROM games WHERE app_id = ?", (game_data['app_id'],))
-            existing_game = cursor.fetchone()
-            
-            if existing_game:
-                # Game exists, check if any data has changed
-                cursor.execute('''
-                    SELECT name, developer, publisher, release_date, 
-                           full_description, short_description, price,
-                           system_requirements, supported_languages,
-                           user_rating, review_count, steam_url, header_image,
-                           screenshot1, screenshot2, screenshot3, screenshot4, screenshot5
-                    FROM games WHERE app_id = ?
-                ''', (game_data['app_id'],))
-                
-                old_data = cursor.fetchone()
-                new_data = (
-                    game_data['name'], game_data['developer'], game_data['publisher'],
-                    game_data['release_date'], game_data['full_description'],
-                    game_data['short_description'], game_data['price'],
-                    game_data['system_requirements'], game_data['supported_languages'],
-                    game_data['user_rating'], game_data['review_count'], game_data['steam_url'],
-                    game_data['header_image'],
-                    game_data.get('screenshot1', ''), game_data.get('screenshot2', ''),
-                    game_data.get('screenshot3', ''), game_data.get('screenshot4', ''),
-                    game_data.get('screenshot5', '')
-                )
-                
-                # If data has changed, log the changes
-                if old_data != new_data:
-                    logging.info(f"Game {game_data['app_id']} ({game_data['name']}) has been updated")
-                    
-                    # Check specifically for release date changes
-                    if old_data[3] != game_data['release_date']:
-                        logging.info(f"Release date changed from '{old_data[3]}' to '{game_data['release_date']}'")
-            
-            # Insert or replace game details
+            if not cursor.fetchone():
+                return
+
             cursor.execute('''
-                INSERT OR REPLACE INTO games (
-                    app_id, name, developer, publisher, release_date,
-                    full_description, short_description, price,
-                    system_requirements, supported_languages,
-                    user_rating, review_count, steam_url, header_image,
-                    screenshot1, screenshot2, screenshot3, screenshot4, screenshot5,
-                    last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+                SELECT name, developer, publisher, release_date, 
+                       full_description, short_description, price,
+                       system_requirements, supported_languages,
+                       user_rating, review_count, steam_url, header_image,
+                       screenshot1, screenshot2, screenshot3, screenshot4, screenshot5
+                FROM games WHERE app_id = ?
+            ''', (game_data['app_id'],))
+
+            old_data = cursor.fetchone()
+            new_data = (
+                game_data['name'], game_data['developer'], game_data['publisher'],
+                game_data['release_date'], game_data['full_description'],
+                game_data['short_description'], game_data['price'],
+                game_data['system_requirements'], game_data['supported_languages'],
+                game_data['user_rating'], game_data['review_count'], game_data['steam_url'],
+                game_data['header_image'],
+                game_data.get('screenshot1', ''), game_data.get('screenshot2', ''),
+                game_data.get('screenshot3', ''), game_data.get('screenshot4', ''),
+                game_data.get('screenshot5', '')
+            )
+
+            # If data has changed, log the changes
+            if old_data != new_data:
+                logging.debug(f"Game {game_data['app_id']} ({game_data['name']}) has been updated")
+
+                # Check specifically for release date changes
+                if old_data[3] != game_data['release_date']:
+                    logging.debug(f"Release date changed from '{old_data[3]}' to '{game_data['release_date']}'")
+        except sqlite3.Error as e:
+            logging.error(f"Database error checking game {game_data['app_id']}: {e}")
+
+    def _flush_locked(self):
+        """Write every queued game inside one transaction"""
+        if not self._pending_games or self.db_conn is None:
+            return
+
+        batch = self._pending_games
+        try:
+            # Drive the transaction explicitly; the connection is in
+            # autocommit mode, which would otherwise fsync per statement.
+            # IMMEDIATE takes the write lock up front instead of risking a
+            # busy upgrade mid-batch under concurrent readers.
+            if not self.db_conn.in_transaction:
+                self.db_conn.execute('BEGIN IMMEDIATE')
+            cursor = self.db_conn.cursor()
+
+            # Insert or replace game details
+            cursor.executemany(SQL_UPSERT_GAME, [(
                 game_data['app_id'], game_data['name'], game_data['developer'],
                 game_data['publisher'], game_data['release_date'],
                 game_data['full_description'], game_data['short_description'],
@@ -469,60 +909,162 @@ class SteamScraper:
                 game_data.get('screenshot1', ''), game_data.get('screenshot2', ''),
                 game_data.get('screenshot3', ''), game_data.get('screenshot4', ''),
                 game_data.get('screenshot5', ''),
+                *release_date_bounds(game_data['release_date']),
                 datetime.now()
-            ))
-            
-            # For tags, first delete existing ones to avoid duplicates
-            cursor.execute("DELETE FROM tags WHERE app_id = ?", (game_data['app_id'],))
-            
-            # Insert tags
-            cursor.executemany('''
-                INSERT INTO tags (app_id, tag) VALUES (?, ?)
-            ''', [(game_data['app_id'], tag) for tag in game_data['tags']])
-            
+            ) for game_data in batch])
+
+            # For tags, first delete existing ones to avoid duplicates --
+            # one indexed IN-list delete for the whole batch
+            app_ids = [game_data['app_id'] for game_data in batch]
+            cursor.execute(
+                f"DELETE FROM tags WHERE app_id IN ({','.join('?' * len(app_ids))})",
+                app_ids)
+
+            # Insert tags, deduped per game (Steam pages can repeat one)
+            cursor.executemany(SQL_INSERT_TAG,
+                               [(game_data['app_id'], tag)
+                                for game_data in batch
+                                for tag in dict.fromkeys(game_data['tags'])])
+
             self.db_conn.commit()
-            
+
+            if self._existing_app_ids is not None:
+                self._existing_app_ids.update(int(game_data['app_id']) for game_data in batch)
+
         except sqlite3.Error as e:
-            logging.error(f"Database error while saving game {game_data['app_id']}: {e}")
+            logging.error(f"Database error while saving batch of {len(batch)} game(s): {e}")
             self.db_conn.rollback()
+        finally:
+            self._pending_games = []
 
-    def export_data(self, format_type, output_path):
-        """Export collected data in the specified format"""
+    def scrape_many(self, urls, max_workers=32, progress_callback=None):
+        """Scrape many detail pages concurrently.
+
+        Fetching and parsing fan out over a bounded thread pool (the work
+        is network-bound); saves are serialised by the database lock and
+        batched by the flush machinery. progress_callback, when given, is
+        called as (url, game_data_or_None) per completed page.
+        """
+        results = []
+        # Bulk runs should always batch commits; honour a caller's larger
+        # setting but never write one transaction per game here
+        self.commit_every = max(self.commit_every, 100)
+        self.start_writer()
         try:
-            cursor = self.db_conn.cursor()
-            
-            # Get all game data with related information
-            cursor.execute('''
-                SELECT g.*, GROUP_CONCAT(DISTINCT t.tag) as tags
-                FROM games g
-                LEFT JOIN tags t ON g.app_id = t.app_id
-                GROUP BY g.app_id
-            ''')
-            
-            columns = [description[0] for description in cursor.description]
-            data = cursor.fetchall()
-            
-            if format_type == 'csv':
-                with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(columns)
-                    writer.writerows(data)
-                    
-            elif format_type == 'json':
-                json_data = []
-                for row in data:
-                    json_data.append(dict(zip(columns, row)))
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_data, f, indent=2)
-                    
-            elif format_type == 'excel':
-                df = pd.DataFrame(data, columns=columns)
-                df.to_excel(output_path, index=False, engine='openpyxl')
-                
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.scrape_game_details, url): url
+                           for url in urls}
+                for future in as_completed(futures):
+                    result = future.result() if future.exception() is None else None
+                    results.append(result)
+                    if progress_callback:
+                        progress_callback(futures[future], result)
+        finally:
+            self.stop_writer()
+            self.flush()
+        return results
+
+    def export_data(self, format_type, output_path, progress_callback=None):
+        """Export collected data in the specified format.
+
+        Rows stream straight off the cursor into the output file, so peak
+        memory stays flat no matter how many games are in the database.
+        progress_callback, when given, receives the running row count
+        after every chunk.
+        """
+        try:
+            # Make sure everything pending is on disk, then read through a
+            # pooled read-only connection so the writer is never blocked
+            self.flush()
+            with self.reader() as conn:
+                self._export_with(conn, format_type, output_path, progress_callback)
         except Exception as e:
             logging.error(f"Error exporting data: {e}")
             raise
 
+    # Rows per write batch (and per progress report) during exports
+    EXPORT_CHUNK = 1000
+
+    def _export_with(self, conn, format_type, output_path, progress_callback=None):
+        """Stream the export query on the given connection in row chunks"""
+        cursor = conn.cursor()
+        cursor.arraysize = self.EXPORT_CHUNK
+
+        # Get all game data with related information
+        cursor.execute('''
+            SELECT g.*, GROUP_CONCAT(DISTINCT t.tag) as tags
+            FROM games g
+            LEFT JOIN tags t ON g.app_id = t.app_id
+            GROUP BY g.app_id
+        ''')
+        
+        columns = [description[0] for description in cursor.description]
+
+        def chunks():
+            exported = 0
+            while True:
+                rows = cursor.fetchmany(self.EXPORT_CHUNK)
+                if not rows:
+                    break
+                yield rows
+                exported += len(rows)
+                if progress_callback:
+                    progress_callback(exported)
+
+        if format_type == 'csv':
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                for rows in chunks():
+                    writer.writerows(rows)
+
+        elif format_type == 'json':
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write('[\n')
+                first = True
+                for rows in chunks():
+                    for row in rows:
+                        if not first:
+                            f.write(',\n')
+                        first = False
+                        f.write(_json_dumps(dict(zip(columns, row))))
+                f.write('\n]')
+
+        elif format_type == 'excel':
+            # constant_memory flushes each row to disk as written
+            workbook = xlsxwriter.Workbook(output_path, {'constant_memory': True})
+            worksheet = workbook.add_worksheet()
+            worksheet.write_row(0, 0, columns)
+            row_no = 1
+            for rows in chunks():
+                for row in rows:
+                    worksheet.write_row(row_no, 0, row)
+                    row_no += 1
+            workbook.close()
+
+        elif format_type == 'parquet':
+            # Columnar + compressed: ~5-10x smaller files that re-read far
+            # faster than xlsx/csv; needs the optional pyarrow dependency
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                raise RuntimeError("Parquet export requires the pyarrow package")
+            writer = None
+            try:
+                for rows in chunks():
+                    table = pa.Table.from_pylist(
+                        [dict(zip(columns, row)) for row in rows])
+                    if writer is None:
+                        writer = pq.ParquetWriter(output_path, table.schema,
+                                                  compression='zstd')
+                    else:
+                        table = table.cast(writer.schema)
+                    writer.write_table(table)
+            finally:
+                if writer is not None:
+                    writer.close()
+
     def ensure_db_connection(self):
         """Ensure database connection is active"""
         try:
@@ -531,7 +1073,8 @@ class SteamScraper:
         except (sqlite3.Error, AttributeError):
             # Reconnect if needed
             try:
-                self.db_conn = sqlite3.connect(self.db_name)
+                self.db_conn = self._open_connection()
+                self._existing_app_ids = None
             except sqlite3.Error as e:
                 logging.error(f"Database reconnection error: {e}")
                 raise
@@ -545,8 +1088,18 @@ class SteamScraper:
     def close_all(self):
         """Close all resources including database"""
         self.close_driver()
+        self.stop_writer()
+        while True:
+            try:
+                self._reader_pool.get_nowait().close()
+            except queue.Empty:
+                break
+        if self.session:
+            self.session.close()
         if self.db_conn:
-            self.db_conn.close()
+            self.flush()
+            if self._owns_connection:
+                self.db_conn.close()
             self.db_conn = None
             
     def close(self):
@@ -564,9 +1117,68 @@ class SteamScraperGUI:
         self.current_game_links = []
         self.current_index = 0
         self.db_name = "steam_games.db"
+
+        # Completed-page events from worker threads, folded into one UI
+        # update per drain tick instead of one per game
+        self._result_q = queue.Queue()
+        self._done_count = 0
+        # Cleared while paused; the worker blocks on it between chunks
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
+        # Database-heavy work (exports) runs on this single worker so a
+        # long query never freezes the window
+        self._db_executor = ThreadPoolExecutor(max_workers=1,
+                                               thread_name_prefix='sqlite-export')
         
+        self.config = self._load_config()
+
         # Create GUI elements
         self.create_widgets()
+
+    CONFIG_PATH = 'scraper_config.json'
+    CHECKPOINT_PATH = 'scrape_checkpoint.json'
+
+    def _load_config(self):
+        """Load persisted settings (rate limit etc.), tolerating absence"""
+        try:
+            with open(self.CONFIG_PATH, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_config(self):
+        """Persist settings for the next run"""
+        try:
+            with open(self.CONFIG_PATH, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=2)
+        except OSError as e:
+            logging.warning(f"Could not save config: {e}")
+
+    def _load_checkpoint(self, url, db_name):
+        """Pending links from an interrupted run against the same url+db"""
+        try:
+            with open(self.CHECKPOINT_PATH, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get('url') == url and data.get('database') == db_name and data.get('pending'):
+            return data['pending']
+        return None
+
+    def _save_checkpoint(self, url, db_name, pending):
+        """Record the links still to scrape so a crash resumes, not restarts"""
+        try:
+            with open(self.CHECKPOINT_PATH, 'w', encoding='utf-8') as f:
+                json.dump({'url': url, 'database': db_name, 'pending': pending}, f)
+        except OSError as e:
+            logging.warning(f"Could not save checkpoint: {e}")
+
+    def _clear_checkpoint(self):
+        try:
+            os.remove(self.CHECKPOINT_PATH)
+        except OSError:
+            pass
         
     def create_widgets(self):
         # URL Input Frame
@@ -587,6 +1199,10 @@ class SteamScraperGUI:
         self.db_entry = ttk.Entry(db_frame, textvariable=self.db_var, width=30)
         self.db_entry.grid(row=0, column=1, padx=5, pady=5, sticky="w")
         ttk.Label(db_frame, text=".db").grid(row=0, column=2, padx=0, pady=5, sticky="w")
+
+        ttk.Label(db_frame, text="Rate limit (req/s):").grid(row=0, column=3, padx=5, pady=5, sticky="w")
+        self.rate_var = tk.StringVar(value=str(self.config.get('requests_per_second', 5)))
+        ttk.Entry(db_frame, textvariable=self.rate_var, width=5).grid(row=0, column=4, padx=5, pady=5, sticky="w")
         
         # Preset URLs
         presets_frame = ttk.LabelFrame(self.root, text="Preset URLs", padding="5")
@@ -656,16 +1272,26 @@ class SteamScraperGUI:
         """Set the URL entry to a preset value"""
         self.url_var.set(url)
         
+    # Links handed to scrape_many per batch; pause/stop are honoured at
+    # batch boundaries
+    SCRAPE_CHUNK = 64
+
+    # Concurrent detail-page fetches; the work is network-bound
+    SCRAPE_WORKERS = 16
+
     def toggle_pause(self):
         """Toggle between pause and resume"""
         self.is_paused = not self.is_paused
+        if self.is_paused:
+            self._resume_event.clear()
+            # Make everything scraped so far durable while we sit idle
+            if self.scraper:
+                self.scraper.flush()
+        else:
+            self._resume_event.set()
         self.pause_button.configure(text="Resume" if self.is_paused else "Pause")
         status = "Paused" if self.is_paused else "Resuming..."
         self.status_var.set(status)
-        
-        if not self.is_paused:
-            # Resume scraping
-            self.root.after(100, self.continue_scraping)
 
     def start_scraping(self):
         """Start the scraping process"""
@@ -699,62 +1325,126 @@ class SteamScraperGUI:
         try:
             # Create a new scraper instance with the provided URL and database
             self.scraper = SteamScraper(url, db_name)
-            self.scraper.initialize_driver()
-            
-            # Get existing games count
-            existing_games = self.scraper.get_existing_app_ids()
-            self.existing_games_var.set(f"Existing Games: {len(existing_games)}")
-            
-            # Get game links
-            self.status_var.set("Collecting game links...")
-            self.current_game_links = self.scraper.scroll_and_collect_games()
-            self.current_index = 0
-            
-            # Update UI with counts
-            self.new_games_var.set(f"New Games: {len(self.current_game_links)}")
-            total_games = len(self.current_game_links) + len(existing_games)
-            self.total_games_var.set(f"Total Games: {total_games}")
-            
-            # Start scraping process
-            self.continue_scraping()
-            
+
+            # Apply and remember the politeness setting
+            try:
+                rate = max(1, int(self.rate_var.get()))
+            except ValueError:
+                rate = 5
+            self.scraper.requests_per_second = rate
+            self.config['requests_per_second'] = rate
+            self._save_config()
+
+            # Everything slow runs off the Tk thread so the window stays
+            # responsive; completion events come back through the result
+            # queue, drained at ~5 Hz
+            self._done_count = 0
+            self._resume_event.set()
+            threading.Thread(target=self._scrape_worker, daemon=True,
+                             name='scrape-worker').start()
+            self.root.after(200, self._drain_results)
+
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
             logging.error(f"Scraping error: {e}")
             self.cleanup()
 
-    def continue_scraping(self):
-        """Continue scraping from where we left off"""
-        if not self.is_scraping or self.is_paused:
-            return
-            
+    def _scrape_worker(self):
+        """Collect links, then scrape them concurrently (background thread).
+
+        Pages are fetched by scrape_many's bounded thread pool instead of
+        one game per 100 ms event-loop tick, so the run is limited by
+        network throughput rather than artificial delays.
+        """
         try:
-            if self.current_index < len(self.current_game_links):
-                link = self.current_game_links[self.current_index]
-                self.status_var.set(f"Scraping game {self.current_index + 1} of {len(self.current_game_links)}")
-                self.scraper.scrape_game_details(link)
-                self.progress_var.set(((self.current_index + 1) / len(self.current_game_links)) * 100)
-                self.current_index += 1
-                
-                # Schedule next game
-                self.root.after(100, self.continue_scraping)
+            existing_games = self.scraper.get_existing_app_ids()
+            self.root.after(0, self.existing_games_var.set,
+                            f"Existing Games: {len(existing_games)}")
+            self.root.after(0, self.status_var.set, "Collecting game links...")
+
+            # An interrupted run resumes from its checkpoint instead of
+            # re-collecting (the collector itself already skips games that
+            # made it into the database)
+            links = self._load_checkpoint(self.scraper.base_url, self.db_name)
+            if links is not None:
+                logging.info(f"Resuming {len(links)} pending links from checkpoint")
             else:
-                self.status_var.set("Scraping completed!")
-                self.cleanup()
-                
+                links = self.scraper.scroll_and_collect_games()
+            self.current_game_links = links
+            self.current_index = 0
+
+            # Update UI with counts
+            self.root.after(0, self.new_games_var.set, f"New Games: {len(links)}")
+            total_games = len(links) + len(existing_games)
+            self.root.after(0, self.total_games_var.set, f"Total Games: {total_games}")
+
+            total = len(links)
+            for chunk_start in range(0, total, self.SCRAPE_CHUNK):
+                self._resume_event.wait()
+                if not self.is_scraping:
+                    break
+
+                chunk = links[chunk_start:chunk_start + self.SCRAPE_CHUNK]
+                self.scraper.scrape_many(chunk, max_workers=self.SCRAPE_WORKERS,
+                                         progress_callback=self._on_game_scraped)
+                self._save_checkpoint(self.scraper.base_url, self.db_name,
+                                      links[chunk_start + len(chunk):])
+
+            if self.is_scraping:
+                self._clear_checkpoint()
+            self.root.after(0, self._scrape_finished, None)
+
         except Exception as e:
-            self.status_var.set(f"Error: {str(e)}")
             logging.error(f"Scraping error: {e}")
-            self.cleanup()
+            self.root.after(0, self._scrape_finished, e)
+
+    def _on_game_scraped(self, link, result):
+        """Per-page progress callback (worker threads): just enqueue"""
+        self._result_q.put((link, result is not None))
+
+    def _drain_results(self):
+        """Fold queued completion events into one UI update (Tk thread)"""
+        drained = 0
+        while True:
+            try:
+                self._result_q.get_nowait()
+            except queue.Empty:
+                break
+            drained += 1
+        if drained:
+            self._done_count += drained
+            self.current_index = self._done_count
+            self._update_progress(self._done_count, len(self.current_game_links))
+        if self.is_scraping:
+            self.root.after(200, self._drain_results)
+
+    def _update_progress(self, done, total):
+        """Reflect progress in the UI (Tk thread)"""
+        if total:
+            self.status_var.set(f"Scraping game {min(done, total)} of {total}")
+            self.progress_var.set((min(done, total) / total) * 100)
+
+    def _scrape_finished(self, error):
+        """Finish up after the worker ends (Tk thread)"""
+        self._drain_results()
+        if error is not None:
+            self.status_var.set(f"Error: {str(error)}")
+        elif not self.is_scraping:
+            self.status_var.set("Scraping stopped.")
+        else:
+            self.status_var.set("Scraping completed!")
+        self.cleanup()
 
     def cleanup(self):
         """Clean up resources and reset UI"""
         self.is_scraping = False
         self.is_paused = False
+        self._resume_event.set()  # release a worker blocked on pause
         self.start_button.configure(state="normal")
         self.pause_button.configure(state="disabled")
         self.pause_button.configure(text="Pause")
         if self.scraper:
+            self.scraper.flush()
             self.scraper.close_driver()
             
     def export_data(self):
@@ -792,13 +1482,29 @@ class SteamScraperGUI:
                 output_path = f"{db_base_name}.{format_type}"
             
             self.status_var.set(f"Exporting data to {output_path}...")
-            self.scraper.export_data(format_type, output_path)
-            self.status_var.set(f"Export completed! Data saved to {output_path}")
+
+            # Run the export off the Tk thread; completion lands back here
+            # via root.after
+            future = self._db_executor.submit(
+                self.scraper.export_data, format_type, output_path,
+                lambda n: self.root.after(0, self.status_var.set,
+                                          f"Exporting... {n} rows written"))
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_export_done, f, output_path))
             
         except Exception as e:
             self.status_var.set(f"Export error: {str(e)}")
             logging.error(f"Export error: {e}")
-            
+
+    def _on_export_done(self, future, output_path):
+        """Report export completion (Tk thread)"""
+        error = future.exception()
+        if error is not None:
+            self.status_var.set(f"Export error: {str(error)}")
+            logging.error(f"Export error: {error}")
+        else:
+            self.status_var.set(f"Export completed! Data saved to {output_path}")
+
     def __del__(self):
         """Destructor to ensure cleanup"""
         if hasattr(self, 'scraper') and self.scraper: